@@ -6,21 +6,22 @@ Implements client side of TCP-like 3-way handshake:
 """
 
 import logging
+import random
 import time
 
 from common.connection import Connection, PeeringError, Role, SessionParams
 from common.encoding import (
-    EncodingError,
-    TransportError,
-    decode_message,
     encode_ack_with_params,
     encode_control,
     generate_connection_id,
+    try_decode_message,
 )
-from common.io import drain_input
+from common.io import drain_input, wait_readable
 from common.protocol import (
     DEFAULT_CLIENT_TIMEOUT_S,
     DEFAULT_SYN_INTERVAL_S,
+    MAX_SYN_INTERVAL_S,
+    RETRANSMIT_JITTER,
     MsgType,
     SerialPort,
 )
@@ -39,31 +40,40 @@ def client_send_syn_wait_syn_ack(
     conn_id: bytes,
     timeout_s: float = DEFAULT_CLIENT_TIMEOUT_S,
     syn_interval_s: float = DEFAULT_SYN_INTERVAL_S,
+    max_syn_interval_s: float = MAX_SYN_INTERVAL_S,
 ) -> bool:
-    """Send SYN periodically and wait for SYN_ACK.
+    """Send SYN with jittered exponential back-off and wait for SYN_ACK.
+
+    The first SYN is sent immediately; the retransmit interval starts at
+    syn_interval_s and doubles after each SYN up to max_syn_interval_s.
 
     Returns True on success, raises HandshakeError on timeout.
     Note: Caller should drain_input() before calling if needed.
     """
     syn_msg = encode_control(MsgType.SYN, conn_id)
-    start = time.monotonic()
-    last_syn = 0.0
+    syn_ack = MsgType.SYN_ACK
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout_s
+    next_syn = 0.0
+    interval = min(syn_interval_s, max_syn_interval_s)
 
     logger.info(f"Client: initiating connection (id={conn_id.hex()})")
 
-    while time.monotonic() - start < timeout_s:
+    while (now := monotonic()) < deadline:
         # Retransmit SYN periodically
-        if time.monotonic() - last_syn > syn_interval_s:
+        if now >= next_syn:
             port.write(syn_msg)
-            last_syn = time.monotonic()
+            next_syn = now + interval * random.uniform(1 - RETRANSMIT_JITTER, 1 + RETRANSMIT_JITTER)
+            interval = min(interval * 2, max_syn_interval_s)
             logger.debug("Client: sent SYN")
 
-        try:
-            msg_type, recv_id, _, crc_ok = decode_message(port)
-        except (TransportError, EncodingError):
+        # Sleep until data arrives or the next SYN is due
+        if not wait_readable(port, max(0.0, min(next_syn, deadline) - now)):
             continue
 
-        if msg_type == MsgType.SYN_ACK and recv_id == conn_id and crc_ok:
+        msg_type, recv_id, _, crc_ok = try_decode_message(port)
+
+        if crc_ok and msg_type is syn_ack and recv_id == conn_id:
             logger.info("Client: received SYN_ACK")
             return True
 
@@ -11,6 +11,7 @@ from client.handshake import client_handshake
 from common.connection import PeeringError, Role, SessionParams
 from common.device import configure_ftdi_latency_timer, open_serial
 from common.report import PeeringReport
+from common.sched import enable_realtime_scheduling
 from session.exchange import client_exchange
 from session.report import SessionReport
 
@@ -33,6 +34,8 @@ def run_client(
     handshake_timeout_s: int,
     msg_count: int,
     no_latency_fix: bool = False,
+    pipeline_depth: int = 1,
+    realtime: bool = False,
 ) -> int:
     """Run client: peering + session data exchange. Returns exit code.
 
@@ -46,8 +49,11 @@ def run_client(
     if not no_latency_fix:
         configure_ftdi_latency_timer(device)
 
+    if realtime:
+        enable_realtime_scheduling()
+
     try:
-        ser = open_serial(device, baudrate, rtscts)
+        ser = open_serial(device, baudrate, rtscts, low_latency=not no_latency_fix)
     except Exception as e:
         logger.error(f"Failed to open serial port: {e}")
         return ExitCode.PEERING_FAILED
@@ -84,7 +90,9 @@ def run_client(
         peering_report.print()
 
         # Perform session data exchange
-        session_result = client_exchange(ser, conn, msg_count=msg_count)
+        session_result = client_exchange(
+            ser, conn, msg_count=msg_count, pipeline_depth=pipeline_depth
+        )
 
         # Print session report
         session_report = SessionReport(result=session_result)
@@ -1,16 +1,13 @@
 """Client shutdown functions for serial-testkit."""
 
 import logging
+import random
 import time
 
 from common.connection import Connection
-from common.encoding import (
-    EncodingError,
-    TransportError,
-    decode_message,
-    encode_control,
-)
-from common.protocol import FIN_WAIT_TIMEOUT_S, MsgType, SerialPort
+from common.encoding import encode_control, try_decode_message
+from common.io import wait_readable
+from common.protocol import FIN_WAIT_TIMEOUT_S, RETRANSMIT_JITTER, MsgType, SerialPort
 
 logger = logging.getLogger(__name__)
 
@@ -20,32 +17,37 @@ def client_shutdown(
 ) -> bool:
     """Client initiates clean shutdown.
 
-    Sends FIN and waits for FIN_ACK.
+    Sends FIN (retransmitting with jittered exponential back-off capped at
+    half the timeout) and waits for FIN_ACK.
     Returns True if FIN_ACK received, False on timeout.
     """
     logger.info("Client: initiating shutdown")
     fin_msg = encode_control(MsgType.FIN, conn.connection_id)
-    start = time.monotonic()
-    last_fin = 0.0
-    fin_interval = 0.5  # Retry FIN more frequently than SYN
-
-    while time.monotonic() - start < timeout_s:
+    fin_ack = MsgType.FIN_ACK
+    conn_id = conn.connection_id
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout_s
+    next_fin = 0.0
+    max_fin_interval = timeout_s / 2
+    # Retry FIN more frequently than SYN, backing off; a short timeout caps
+    # even the first interval
+    fin_interval = min(0.5, max_fin_interval)
+
+    while (now := monotonic()) < deadline:
         # Retransmit FIN periodically
-        if time.monotonic() - last_fin > fin_interval:
+        if now >= next_fin:
             port.write(fin_msg)
-            last_fin = time.monotonic()
+            next_fin = now + fin_interval * random.uniform(1 - RETRANSMIT_JITTER, 1 + RETRANSMIT_JITTER)
+            fin_interval = min(fin_interval * 2, max_fin_interval)
             logger.debug("Client: sent FIN")
 
-        try:
-            msg_type, recv_id, _, crc_ok = decode_message(port)
-        except (TransportError, EncodingError):
+        # Sleep until data arrives or the next FIN is due
+        if not wait_readable(port, max(0.0, min(next_fin, deadline) - now)):
             continue
 
-        if (
-            msg_type == MsgType.FIN_ACK
-            and recv_id == conn.connection_id
-            and crc_ok
-        ):
+        msg_type, recv_id, _, crc_ok = try_decode_message(port)
+
+        if crc_ok and msg_type is fin_ack and recv_id == conn_id:
             logger.info("Client: received FIN_ACK, shutdown complete")
             return True
 
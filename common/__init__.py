@@ -5,7 +5,7 @@ This package contains shared code used by both client and server:
 - connection: SessionParams, Connection dataclasses
 - message: Wire format encoding/decoding
 - encoding: Peering message encoding/decoding
-- io: Serial I/O helpers (drain_input, send_data, recv_data)
+- io: Serial I/O helpers (drain_input, send_data, recv_data, wait_readable)
 - device: Serial device setup and FTDI configuration
 - report: Reporting abstractions
 """
@@ -22,8 +22,13 @@ from common.protocol import (
     CONN_ID_SIZE,
     DEFAULT_ACK_TIMEOUT_S,
     DEFAULT_CLIENT_TIMEOUT_S,
+    DEFAULT_RESPONSE_TIMEOUT_S,
     DEFAULT_SYN_INTERVAL_S,
     FIN_WAIT_TIMEOUT_S,
+    MAX_PIPELINE_DEPTH,
+    MAX_SYN_INTERVAL_S,
+    MIN_MESSAGE_LENGTH,
+    RETRANSMIT_JITTER,
     MsgType,
     SerialPort,
 )
@@ -33,10 +38,15 @@ __all__ = [
     "MsgType",
     "SerialPort",
     "CONN_ID_SIZE",
+    "MIN_MESSAGE_LENGTH",
     "DEFAULT_CLIENT_TIMEOUT_S",
     "DEFAULT_SYN_INTERVAL_S",
+    "MAX_SYN_INTERVAL_S",
+    "RETRANSMIT_JITTER",
     "DEFAULT_ACK_TIMEOUT_S",
+    "DEFAULT_RESPONSE_TIMEOUT_S",
     "FIN_WAIT_TIMEOUT_S",
+    "MAX_PIPELINE_DEPTH",
     # Connection
     "SessionParams",
     "Connection",
@@ -2,20 +2,41 @@
 
 Contains:
 - configure_ftdi_latency_timer: Configure FTDI latency timer for reliable RTS/CTS
+- enable_low_latency: Set the ASYNC_LOW_LATENCY flag on an open Linux tty
 - log_device_info: Log information about a serial device
+- read_timeout_for: Per-read timeout derived from the baud rate
 - open_serial: Open and configure a serial port
 """
 
 import logging
 import os
+import sys
 
 import serial
 import serial.tools.list_ports
+from serial.tools.list_ports_common import ListPortInfo
+
+from common.io import BufferedSerial
+from common.protocol import MAX_SESSION_FRAME_SIZE
 
 logger = logging.getLogger(__name__)
 
 FTDI_LATENCY_TIMER_TARGET = 1
 
+# Per-read timeout floor. Reads only need to cover one frame's transfer time;
+# callers wait for a frame to start arriving with select() (see common.io).
+MIN_READ_TIMEOUT_S = 0.01
+
+
+def read_timeout_for(baudrate: int) -> float:
+    """Return the per-read timeout for a baud rate.
+
+    Twice the wire time of a MAX_SESSION_FRAME_SIZE frame, assuming 8N1
+    framing (10 bits per byte), with a MIN_READ_TIMEOUT_S (10ms) floor:
+    about 50ms at 115200, 600ms at 9600 and the floor at 921600.
+    """
+    return max(MIN_READ_TIMEOUT_S, 2 * MAX_SESSION_FRAME_SIZE * 10 / baudrate)
+
 
 def configure_ftdi_latency_timer(device: str) -> bool:
     """Configure FTDI latency timer to 1ms for reliable RTS/CTS."""
@@ -27,22 +48,18 @@ def configure_ftdi_latency_timer(device: str) -> bool:
 
     sysfs_path = f"/sys/bus/usb-serial/devices/{device_name}/latency_timer"
 
-    if not os.path.exists(sysfs_path):
-        logger.warning(f"Cannot configure latency timer: {sysfs_path} not found")
-        return False
-
     try:
-        with open(sysfs_path, "r") as f:
+        with open(sysfs_path, "r+") as f:
             current_value = int(f.read().strip())
 
-        if current_value == FTDI_LATENCY_TIMER_TARGET:
-            logger.debug(f"Latency timer already set to {FTDI_LATENCY_TIMER_TARGET}ms")
-            return True
+            if current_value == FTDI_LATENCY_TIMER_TARGET:
+                logger.debug(f"Latency timer already set to {FTDI_LATENCY_TIMER_TARGET}ms")
+                return True
 
-        with open(sysfs_path, "w") as f:
+            f.seek(0)
             f.write(str(FTDI_LATENCY_TIMER_TARGET))
-
-        with open(sysfs_path, "r") as f:
+            f.flush()
+            f.seek(0)
             new_value = int(f.read().strip())
 
         if new_value == FTDI_LATENCY_TIMER_TARGET:
@@ -57,7 +74,18 @@ def configure_ftdi_latency_timer(device: str) -> bool:
             )
             return False
 
+    except FileNotFoundError:
+        logger.warning(f"Cannot configure latency timer: {sysfs_path} not found")
+        return False
     except PermissionError:
+        # Opening for write needs root, but an already-correct value is fine
+        try:
+            with open(sysfs_path, "r") as f:
+                if int(f.read().strip()) == FTDI_LATENCY_TIMER_TARGET:
+                    logger.debug(f"Latency timer already set to {FTDI_LATENCY_TIMER_TARGET}ms")
+                    return True
+        except (OSError, ValueError):
+            pass
         logger.warning("Cannot configure latency timer: permission denied (run with sudo)")
         return False
     except Exception as e:
@@ -65,21 +93,58 @@ def configure_ftdi_latency_timer(device: str) -> bool:
         return False
 
 
+def enable_low_latency(ser: serial.Serial) -> bool:
+    """Set ASYNC_LOW_LATENCY on an open tty (Linux only).
+
+    Unlike the sysfs latency timer this works for any driver that honours
+    TIOCSSERIAL, not just FTDI. Returns True if the flag was set.
+    """
+    set_low_latency_mode = getattr(ser, "set_low_latency_mode", None)
+    if set_low_latency_mode is None:
+        logger.debug("Low latency mode not supported on this platform")
+        return False
+
+    try:
+        set_low_latency_mode(True)
+    except ValueError as e:
+        # ptys and some USB drivers do not implement TIOCGSERIAL
+        logger.debug(f"Low latency mode not available: {e}")
+        return False
+
+    logger.debug("Enabled ASYNC_LOW_LATENCY on serial port")
+    return True
+
+
+def _port_info(device: str) -> ListPortInfo | None:
+    """Look up port info for a device, or None if it is not a listed port."""
+    if sys.platform.startswith("linux"):
+        # Describe just this tty from sysfs instead of enumerating every port
+        from serial.tools.list_ports_linux import SysFS
+
+        info = SysFS(device)
+        return info if info.subsystem not in (None, "platform") else None
+
+    ports = [p for p in serial.tools.list_ports.comports() if p.device == device]
+    if len(ports) > 1:
+        raise RuntimeError(f"Multiple ports found for device {device}")
+    return ports[0] if ports else None
+
+
 def log_device_info(device: str) -> None:
     """Log information about a serial device."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     real_path = os.path.realpath(device)
     if real_path.startswith("/dev/pts/"):
         logger.info(f"Device: {device} -> {real_path} (pty)")
         return
 
-    ports = [p for p in serial.tools.list_ports.comports() if p.device == device]
-    if len(ports) == 0:
+    info = _port_info(real_path)
+    if info is None:
         logger.info(f"Device: {device} (not in port list)")
         return
-    if len(ports) > 1:
-        raise RuntimeError(f"Multiple ports found for device {device}")
 
-    info = ports[0]
     logger.info(f"Device: {info.device}")
     logger.info(f"Description: {info.description}")
     if info.vid is not None:
@@ -90,8 +155,20 @@ def open_serial(
     device: str,
     baudrate: int,
     rtscts: bool = False,
-) -> serial.Serial:
-    """Open and configure a serial port."""
+    low_latency: bool = True,
+    read_timeout: float | None = None,
+) -> BufferedSerial:
+    """Open and configure a serial port.
+
+    When low_latency is set, ASYNC_LOW_LATENCY is enabled on the tty where
+    the driver supports it. read_timeout defaults to read_timeout_for(baudrate),
+    twice the wire time of the largest session frame with a 10ms floor, so a
+    read that comes up short returns soon after a frame could have arrived.
+    The port is returned wrapped in a BufferedSerial so a frame is read with
+    as few syscalls as possible.
+    """
+    if read_timeout is None:
+        read_timeout = read_timeout_for(baudrate)
     log_device_info(device)
     ser = serial.Serial(
         port=device,
@@ -101,9 +178,13 @@ def open_serial(
         stopbits=serial.STOPBITS_ONE,
         xonxoff=False,
         rtscts=rtscts,
-        timeout=0.1,
+        timeout=read_timeout,
         write_timeout=1.0,
     )
     ser.reset_output_buffer()
-    logger.debug(f"Serial port: baudrate={ser.baudrate}, rtscts={ser.rtscts}")
-    return ser
+    if low_latency:
+        enable_low_latency(ser)
+    logger.debug(
+        f"Serial port: baudrate={ser.baudrate}, rtscts={ser.rtscts}, timeout={ser.timeout:.3f}s"
+    )
+    return BufferedSerial(ser)
@@ -4,13 +4,29 @@ Contains functions for encoding and decoding peering protocol messages:
 - Control messages (SYN, SYN_ACK, ACK, FIN, FIN_ACK)
 - Data messages with connection ID
 - ACK messages with session parameters
+- try_decode_message: exception-free decoding for polling loops
 """
 
-import os
+import functools
+import random
+import zlib
 
 from common import message
 from common.connection import SessionParams
-from common.protocol import CONN_ID_SIZE, MsgType, SerialPort
+from common.protocol import CONN_ID_SIZE, MIN_MESSAGE_LENGTH, MsgType, SerialPort
+
+
+# Lookup table so decoding an unknown type byte does not raise ValueError
+_MSG_TYPES = {t.value: t for t in MsgType}
+
+# Control frames have a fixed layout, so sync magic and length are encoded
+# once and each call only fills in type, conn_id and CRC
+_CONTROL_LENGTH = 1 + CONN_ID_SIZE
+_CONTROL_TEMPLATE = message.encode(bytes(_CONTROL_LENGTH))
+_CONTROL_CRC_OFFSET = message.HEADER_SIZE + _CONTROL_LENGTH
+
+# Returned by try_decode_message when no valid message could be decoded
+_NO_MESSAGE: tuple[None, bytes, bytes, bool] = (None, b"", b"", False)
 
 
 class EncodingError(Exception):
@@ -26,14 +42,27 @@ class TransportError(Exception):
 
 
 def generate_connection_id() -> bytes:
-    """Generate random 4-byte connection ID."""
-    return os.urandom(CONN_ID_SIZE)
+    """Generate random 4-byte connection ID.
+
+    The ID only distinguishes connections (it is not a secret), so the
+    module PRNG, seeded from the OS once per process, is sufficient.
+    """
+    return random.randbytes(CONN_ID_SIZE)
 
 
+@functools.lru_cache(maxsize=64)
 def encode_control(msg_type: MsgType, conn_id: bytes) -> bytes:
-    """Encode a control message (SYN/SYN_ACK/ACK/FIN/FIN_ACK)."""
-    payload = bytes([msg_type]) + conn_id
-    return message.encode(payload)
+    """Encode a control message (SYN/SYN_ACK/ACK/FIN/FIN_ACK).
+
+    Results are cached: a connection only ever sends a handful of distinct
+    control frames, so each is encoded once per connection lifetime.
+    """
+    buf = bytearray(_CONTROL_TEMPLATE)
+    buf[message.HEADER_SIZE] = msg_type
+    buf[message.HEADER_SIZE + 1 : _CONTROL_CRC_OFFSET] = conn_id
+    crc = zlib.crc32(memoryview(buf)[message.HEADER_SIZE : _CONTROL_CRC_OFFSET])
+    buf[_CONTROL_CRC_OFFSET:] = message.uint32_to_bytes(crc)
+    return bytes(buf)
 
 
 def encode_ack_with_params(conn_id: bytes, session_params: SessionParams) -> bytes:
@@ -60,9 +89,7 @@ def decode_ack_with_params(payload: bytes) -> tuple[bytes, SessionParams]:
         raise EncodingError(f"ACK payload too short: {len(payload)} bytes, need at least {1 + CONN_ID_SIZE + 4}")
 
     conn_id = payload[1 : 1 + CONN_ID_SIZE]
-    msg_count = message.uint32_from_bytes(
-        payload[1 + CONN_ID_SIZE : 1 + CONN_ID_SIZE + 4]
-    )
+    msg_count = message.uint32_from_bytes(payload, 1 + CONN_ID_SIZE)
     return conn_id, SessionParams(msg_count=msg_count)
 
 
@@ -80,15 +107,13 @@ def decode_message(
     Returns (msg_type, conn_id, data, crc_ok).
 
     Raises:
-        TransportError: On timeout or truncated message.
-        EncodingError: On invalid message format (bad MsgType, too short).
+        TransportError: On timeout, truncated or undersized message.
+        EncodingError: On invalid message format (bad MsgType).
     """
-    payload, crc_ok = message.decode(reader)
+    # Frames too short to hold type + conn_id are discarded before the body read
+    payload, crc_ok = message.decode(reader, min_length=MIN_MESSAGE_LENGTH)
     if payload is None:
-        raise TransportError("Timeout or truncated message")
-
-    if len(payload) < 1 + CONN_ID_SIZE:
-        raise EncodingError(f"Payload too short: {len(payload)} bytes, need at least {1 + CONN_ID_SIZE}")
+        raise TransportError("Timeout, truncated or undersized message")
 
     try:
         msg_type = MsgType(payload[0])
@@ -98,3 +123,24 @@ def decode_message(
     conn_id = payload[1 : 1 + CONN_ID_SIZE]
     data = payload[1 + CONN_ID_SIZE :] if len(payload) > 1 + CONN_ID_SIZE else b""
     return msg_type, conn_id, data, crc_ok
+
+
+def try_decode_message(
+    reader: SerialPort,
+) -> tuple[MsgType | None, bytes, bytes, bool]:
+    """Decode message from reader without raising.
+
+    Returns (msg_type, conn_id, data, crc_ok) like decode_message, or
+    (None, b"", b"", False) on timeout, truncation or invalid format.
+    Polling loops that ignore bad frames use this to avoid paying for an
+    exception on every empty or noisy read.
+    """
+    payload, crc_ok = message.decode(reader, min_length=MIN_MESSAGE_LENGTH)
+    if payload is None:
+        return _NO_MESSAGE
+
+    msg_type = _MSG_TYPES.get(payload[0])
+    if msg_type is None:
+        return _NO_MESSAGE
+
+    return msg_type, payload[1 : 1 + CONN_ID_SIZE], payload[1 + CONN_ID_SIZE :], crc_ok
@@ -1,19 +1,78 @@
 """Serial I/O helpers for serial-testkit.
 
 Contains:
+- BufferedSerial: Read-buffering wrapper around a serial port
 - drain_input: Clear stale data from input buffer
 - send_data: Send DATA message with connection ID
+- send_data_batch: Send several DATA messages with one write
 - recv_data: Receive DATA message, filtering by connection ID
+- wait_readable: Block until input is available or a timeout elapses
 """
 
 import logging
+import select
+import time
+from typing import Any
 
 from common.connection import Connection, ConnectionMismatchError, UnexpectedMessageError
-from common.encoding import decode_message, encode_data
+from common.encoding import TransportError, decode_message, encode_data
 from common.protocol import MsgType, SerialPort
 
 logger = logging.getLogger(__name__)
 
+# IntEnum members are singletons, so recv_data can dispatch on identity
+_DATA = MsgType.DATA
+_FIN = MsgType.FIN
+
+# Sleep granularity for ports without a selectable file descriptor (mocks)
+POLL_FALLBACK_S = 0.01
+
+# Upper bound on bytes pulled from the port by a single BufferedSerial refill
+READ_CHUNK_SIZE = 4096
+
+
+class BufferedSerial:
+    """Read-buffering wrapper around a SerialPort.
+
+    Decoding a frame takes several small reads. Each read() is served from
+    an in-process buffer; when that runs short, one port read fetches the
+    missing bytes plus whatever the port already has pending, so the rest
+    of the frame costs no further syscalls. Reads never block for more
+    than the bytes requested. Other attributes pass through to the port.
+    """
+
+    def __init__(self, port: SerialPort) -> None:
+        self._port = port
+        self._buffer = bytearray()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._port, name)
+
+    def write(self, data: bytes, /) -> int | None:
+        return self._port.write(data)
+
+    def read(self, size: int = 1, /) -> bytes:
+        buffer = self._buffer
+        need = size - len(buffer)
+        if need > 0:
+            port = self._port
+            buffer += port.read(max(need, min(port.in_waiting, READ_CHUNK_SIZE)))
+        data = bytes(buffer[:size])
+        del buffer[:size]
+        return data
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._buffer) + self._port.in_waiting
+
+    def reset_input_buffer(self) -> None:
+        """Discard buffered bytes along with the port's pending input."""
+        self._buffer.clear()
+        self._port.reset_input_buffer()
+
+    # Deprecated pyserial alias, kept so the wrapper stays a drop-in port
+    flushInput = reset_input_buffer
+
 
 def drain_input(port: SerialPort) -> int:
     """Drain stale data from input buffer. Returns bytes drained."""
@@ -24,16 +83,46 @@ def drain_input(port: SerialPort) -> int:
     return count
 
 
+def wait_readable(port: SerialPort, timeout_s: float) -> bool:
+    """Wait until the port has input available. Returns True if readable.
+
+    Uses select() on the port's file descriptor so the caller sleeps until
+    data arrives instead of spinning on timed-out reads. Ports without a
+    fileno() (e.g., test mocks) fall back to polling in_waiting.
+    """
+    if port.in_waiting > 0:
+        return True
+    fileno = getattr(port, "fileno", None)
+    if fileno is None:
+        deadline = time.monotonic() + timeout_s
+        while (remaining := deadline - time.monotonic()) > 0:
+            time.sleep(min(remaining, POLL_FALLBACK_S))
+            if port.in_waiting > 0:
+                return True
+        return False
+    readable, _, _ = select.select([fileno()], [], [], timeout_s)
+    return bool(readable)
+
+
 def send_data(port: SerialPort, conn: Connection, payload: bytes) -> int | None:
     """Send a DATA message. Returns bytes written."""
     return port.write(encode_data(conn.connection_id, payload))
 
 
+def send_data_batch(port: SerialPort, conn: Connection, payloads: list[bytes]) -> int | None:
+    """Send consecutive DATA messages in a single write. Returns bytes written."""
+    conn_id = conn.connection_id
+    return port.write(b"".join([encode_data(conn_id, payload) for payload in payloads]))
+
+
 def recv_data(
-    port: SerialPort, conn: Connection
+    port: SerialPort, conn: Connection, timeout_s: float | None = None
 ) -> tuple[bytes, bool, MsgType]:
     """Receive a DATA message, filtering by connection ID.
 
+    If timeout_s is given, wait up to that long for the message to start
+    arriving; otherwise rely on the port's own read timeout.
+
     Returns (payload, crc_ok, msg_type):
     - (payload, True/False, DATA) for data messages with matching conn_id
     - (b"", False, FIN) if FIN received with matching conn_id
@@ -44,6 +133,9 @@ def recv_data(
         ConnectionMismatchError: If message has wrong connection ID.
         UnexpectedMessageError: If message type is not DATA or FIN.
     """
+    if timeout_s is not None and not wait_readable(port, timeout_s):
+        raise TransportError(f"Timeout ({timeout_s}s) waiting for message")
+
     msg_type, recv_id, data, crc_ok = decode_message(port)
 
     if recv_id != conn.connection_id:
@@ -51,10 +143,8 @@ def recv_data(
             f"Expected conn_id={conn.connection_id.hex()}, got {recv_id.hex()}"
         )
 
-    match msg_type:
-        case MsgType.DATA:
-            return data, crc_ok, MsgType.DATA
-        case MsgType.FIN:
-            return b"", False, MsgType.FIN
-        case _:
-            raise UnexpectedMessageError(f"Expected DATA or FIN, got {msg_type.name}")
+    if msg_type is _DATA:
+        return data, crc_ok, _DATA
+    if msg_type is _FIN:
+        return b"", False, _FIN
+    raise UnexpectedMessageError(f"Expected DATA or FIN, got {msg_type.name}")
@@ -9,8 +9,10 @@ to a stream mid-message or after buffer corruption).
 All integers are little-endian unsigned 32-bit.
 """
 
+import functools
 import logging
 import random
+import struct
 import zlib
 from typing import Literal, Protocol
 
@@ -20,6 +22,13 @@ UINT32_SIZE = 4
 UINT64_SIZE = 8
 BYTE_ORDER: Literal["little", "big"] = "little"
 
+# Precompiled little-endian codecs (faster than int.to_bytes/from_bytes)
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+# Frame checksum (CRC-32/ISO-HDLC, as on the wire since the first release)
+_crc32 = zlib.crc32
+
 # Sync magic for message framing (chosen to be unlikely in random data)
 SYNC_MAGIC = 0x5E5A1000
 SYNC_MAGIC_BYTES = SYNC_MAGIC.to_bytes(UINT32_SIZE, BYTE_ORDER, signed=False)
@@ -30,9 +39,20 @@ MAX_MESSAGE_LENGTH = 4096
 # Maximum bytes to scan when resyncing (prevents infinite loop on garbage)
 MAX_RESYNC_BYTES = 8192
 
-# Payload size range for random messages
+# Frame header: sync magic + length
+HEADER_SIZE = UINT32_SIZE * 2
+
+# Smallest possible frame: header + empty payload + CRC
+MIN_FRAME_SIZE = HEADER_SIZE + UINT32_SIZE
+
+# Bytes read per resync step (bounded so a scan never consumes past a frame)
+RESYNC_CHUNK_SIZE = MIN_FRAME_SIZE - (UINT32_SIZE - 1)
+
+# Payload size range for random messages. The inclusive range must span a
+# power of two (2**PAYLOAD_SIZE_BITS sizes) so a size is one masked draw.
+PAYLOAD_SIZE_BITS = 8
 MIN_PAYLOAD_SIZE = 16
-MAX_PAYLOAD_SIZE = 256
+MAX_PAYLOAD_SIZE = MIN_PAYLOAD_SIZE + (1 << PAYLOAD_SIZE_BITS) - 1  # 271
 
 
 class Reader(Protocol):
@@ -43,90 +63,116 @@ class Reader(Protocol):
 
 def uint32_to_bytes(value: int) -> bytes:
     """Encode unsigned 32-bit int as little-endian bytes."""
-    return value.to_bytes(UINT32_SIZE, BYTE_ORDER, signed=False)
+    return _U32.pack(value)
 
 
-def uint32_from_bytes(data: bytes) -> int:
-    """Decode little-endian bytes to unsigned 32-bit int."""
-    return int.from_bytes(data, BYTE_ORDER, signed=False)
+def uint32_from_bytes(data: bytes, offset: int = 0) -> int:
+    """Decode little-endian bytes at offset to unsigned 32-bit int."""
+    return _U32.unpack_from(data, offset)[0]
 
 
 def uint64_to_bytes(value: int) -> bytes:
     """Encode unsigned 64-bit int as little-endian bytes."""
-    return value.to_bytes(UINT64_SIZE, BYTE_ORDER, signed=False)
+    return _U64.pack(value)
 
 
-def uint64_from_bytes(data: bytes) -> int:
-    """Decode little-endian bytes to unsigned 64-bit int."""
-    return int.from_bytes(data, BYTE_ORDER, signed=False)
+def uint64_from_bytes(data: bytes, offset: int = 0) -> int:
+    """Decode little-endian bytes at offset to unsigned 64-bit int."""
+    return _U64.unpack_from(data, offset)[0]
 
 
 def random_payload() -> bytes:
     """Generate a random payload of random length."""
-    size = random.randint(MIN_PAYLOAD_SIZE, MAX_PAYLOAD_SIZE)
-    return bytes(random.getrandbits(8) for _ in range(size))
+    size = MIN_PAYLOAD_SIZE + random.getrandbits(PAYLOAD_SIZE_BITS)
+    return random.randbytes(size)
+
+
+@functools.lru_cache(maxsize=512)
+def _frame_struct(length: int) -> struct.Struct:
+    """Return a packer for a whole frame with a payload of the given length."""
+    return struct.Struct(f"<II{length}sI")
 
 
 def encode(payload: bytes) -> bytes:
     """Encode a byte payload with sync magic, length prefix and CRC32 suffix."""
-    length = uint32_to_bytes(len(payload))
-    crc = uint32_to_bytes(zlib.crc32(payload))
-    return SYNC_MAGIC_BYTES + length + payload + crc
+    n = len(payload)
+    return _frame_struct(n).pack(SYNC_MAGIC, n, payload, _crc32(payload))
 
 
-def decode(reader: Reader) -> tuple[bytes | None, bool]:
+def _take(reader: Reader, pending: bytearray, size: int) -> bytes:
+    """Read size bytes, consuming any bytes left over from the resync scan first."""
+    if not pending:
+        return reader.read(size)
+    data = bytes(pending[:size])
+    del pending[:size]
+    if len(data) < size:
+        data += reader.read(size - len(data))
+    return data
+
+
+def decode(reader: Reader, min_length: int = 0) -> tuple[bytes | None, bool]:
     """Decode a message from a reader with resync capability.
 
     Returns (payload, crc_ok) or (None, False) on failure/timeout.
+    Frames whose length field is below min_length or above
+    MAX_MESSAGE_LENGTH are rejected before their body is read.
 
     If the stream is misaligned (e.g., due to connecting mid-message or
     buffer corruption), this function will scan for the sync magic and
     resynchronize.
     """
-    # Read potential sync magic
-    sync_bytes = reader.read(UINT32_SIZE)
-    if len(sync_bytes) < UINT32_SIZE:
+    # Read potential sync magic and length together (every frame is longer)
+    scan = bytearray(reader.read(HEADER_SIZE))
+    if len(scan) < UINT32_SIZE:
         return None, False
 
-    # Check if we have valid sync magic
-    bytes_scanned = 0
-    while sync_bytes != SYNC_MAGIC_BYTES:
-        if bytes_scanned >= MAX_RESYNC_BYTES:
-            logger.warning(f"Failed to resync after scanning {bytes_scanned} bytes")
-            return None, False
-
-        # Shift by one byte and read another
-        next_byte = reader.read(1)
-        if len(next_byte) < 1:
-            return None, False
-
-        sync_bytes = sync_bytes[1:] + next_byte
-        bytes_scanned += 1
-
-    if bytes_scanned > 0:
+    idx = scan.find(SYNC_MAGIC_BYTES)
+    if idx != 0:
+        # Scan for the sync magic in chunks. A frame that starts in the
+        # retained tail is at least MIN_FRAME_SIZE bytes long, so a chunk of
+        # RESYNC_CHUNK_SIZE bytes never reads past the end of that frame.
+        bytes_scanned = 0
+        while idx < 0:
+            # Keep the last 3 bytes: they may be the start of a split sync magic
+            drop = len(scan) - (UINT32_SIZE - 1)
+            del scan[:drop]
+            bytes_scanned += drop
+            if bytes_scanned >= MAX_RESYNC_BYTES:
+                logger.warning(f"Failed to resync after scanning {bytes_scanned} bytes")
+                return None, False
+
+            chunk = reader.read(RESYNC_CHUNK_SIZE)
+            if not chunk:
+                return None, False
+            scan += chunk
+            idx = scan.find(SYNC_MAGIC_BYTES)
+
+        bytes_scanned += idx
         logger.debug(f"Resynced after skipping {bytes_scanned} bytes")
+    pending = scan[idx + UINT32_SIZE :]
 
     # Read length
-    length_bytes = reader.read(UINT32_SIZE)
+    length_bytes = _take(reader, pending, UINT32_SIZE)
     if len(length_bytes) < UINT32_SIZE:
         return None, False
 
-    length = uint32_from_bytes(length_bytes)
+    (length,) = _U32.unpack(length_bytes)
 
     # Sanity check length to avoid huge allocations
     if length > MAX_MESSAGE_LENGTH:
         logger.warning(f"Message length {length} exceeds max {MAX_MESSAGE_LENGTH}, resyncing")
         return None, False
+    if length < min_length:
+        logger.warning(f"Message length {length} below min {min_length}, resyncing")
+        return None, False
 
-    # Read payload
-    payload = reader.read(length)
-
-    # Read CRC
-    crc_bytes = reader.read(UINT32_SIZE)
-    if len(payload) < length or len(crc_bytes) < UINT32_SIZE:
+    # Read payload and CRC in one call
+    body = _take(reader, pending, length + UINT32_SIZE)
+    if len(body) < length + UINT32_SIZE:
         return None, False
 
-    expected_crc = uint32_from_bytes(crc_bytes)
-    actual_crc = zlib.crc32(payload)
+    # Checksum the payload through a view so only the returned copy is made,
+    # and compare against the CRC field unpacked in place
+    crc_ok = _U32.unpack_from(body, length)[0] == _crc32(memoryview(body)[:length])
 
-    return payload, expected_crc == actual_crc
+    return body[:length], crc_ok
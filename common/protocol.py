@@ -13,7 +13,7 @@ from enum import IntEnum
 
 from typing import Protocol
 
-from common.message import Reader
+from common.message import MAX_PAYLOAD_SIZE, MIN_FRAME_SIZE, Reader
 
 # TRACE logging level (below DEBUG)
 TRACE = 5
@@ -46,8 +46,25 @@ class SerialPort(Reader, Protocol):
 # Connection ID size in bytes
 CONN_ID_SIZE = 4
 
+# Smallest valid peering payload: type (1) + conn_id
+MIN_MESSAGE_LENGTH = 1 + CONN_ID_SIZE
+
+# Largest frame exchanged in a session: random payload + type + conn_id + framing
+MAX_SESSION_FRAME_SIZE = MAX_PAYLOAD_SIZE + MIN_MESSAGE_LENGTH + MIN_FRAME_SIZE
+
+# Transmit buffer assumed for a tty (Linux serial drivers queue 4 KiB). A burst
+# that fits is queued by one write without waiting on the UART, so it cannot
+# run into the port's write timeout at any baud rate.
+TX_BUFFER_SIZE = 4096
+
+# Deepest client pipeline whose burst always fits in TX_BUFFER_SIZE
+MAX_PIPELINE_DEPTH = TX_BUFFER_SIZE // MAX_SESSION_FRAME_SIZE
+
 # Default timing constants
 DEFAULT_CLIENT_TIMEOUT_S = 60.0  # Server waits this long for client
-DEFAULT_SYN_INTERVAL_S = 2.0  # Client sends SYN at this interval
+DEFAULT_SYN_INTERVAL_S = 2.0  # Client sends first SYN retransmit after this interval
+MAX_SYN_INTERVAL_S = 8.0  # SYN retransmit interval doubles up to this cap
+RETRANSMIT_JITTER = 0.1  # Retransmit intervals are randomized by +/- this fraction
 DEFAULT_ACK_TIMEOUT_S = 10.0  # Wait for ACK after SYN_ACK sent
 FIN_WAIT_TIMEOUT_S = 5.0  # Wait for FIN_ACK before force close
+DEFAULT_RESPONSE_TIMEOUT_S = 1.0  # Wait for each DATA message during a session
@@ -0,0 +1,38 @@
+"""Process scheduling helpers for serial-testkit.
+
+Contains:
+- enable_realtime_scheduling: Move the process to the SCHED_FIFO class (Linux)
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# SCHED_FIFO priority for the test process. Kept below the default priority
+# of threaded IRQ handlers (50) so the serial driver is never starved.
+REALTIME_PRIORITY = 40
+
+
+def enable_realtime_scheduling(priority: int = REALTIME_PRIORITY) -> bool:
+    """Run the process under SCHED_FIFO to keep scheduler jitter out of RTTs.
+
+    Needs root or CAP_SYS_NICE; failure is logged and the process keeps its
+    normal scheduling. Returns True if the policy was applied.
+    """
+    sched_setscheduler = getattr(os, "sched_setscheduler", None)
+    if sched_setscheduler is None:
+        logger.warning("Realtime scheduling not supported on this platform")
+        return False
+
+    try:
+        sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except PermissionError:
+        logger.warning("Cannot enable realtime scheduling: permission denied (run with sudo)")
+        return False
+    except OSError as e:
+        logger.warning(f"Failed to enable realtime scheduling: {e}")
+        return False
+
+    logger.info(f"Realtime scheduling enabled (SCHED_FIFO, priority {priority})")
+    return True
@@ -12,6 +12,7 @@ Protocol:
 """
 
 import logging
+import struct
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -66,12 +67,20 @@ RESPONDER_TIMEOUT_MULTIPLIER = 2
 # -----------------------------------------------------------------------------
 
 
+_U64_MASK = 0xFFFFFFFFFFFFFFFF
+
+
 def make_test_id(timestamp_ns: int) -> int:
     """Create a test ID from the initiator's nanosecond timestamp.
 
-    Uses a simple hash to create a 64-bit test ID.
+    Uses the splitmix64 finalizer so both peers derive the same 64-bit ID
+    regardless of platform (hash() of an int depends on the build's word
+    size, so 32-bit and 64-bit peers would disagree).
     """
-    return hash(timestamp_ns) & 0xFFFFFFFFFFFFFFFF
+    x = timestamp_ns & _U64_MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _U64_MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _U64_MASK
+    return x ^ (x >> 31)
 
 
 # -----------------------------------------------------------------------------
@@ -79,28 +88,30 @@ def make_test_id(timestamp_ns: int) -> int:
 # -----------------------------------------------------------------------------
 
 
+# Payload layouts (little-endian, packed in a single call)
+_INIT_STRUCT = struct.Struct("<QQI")  # magic + timestamp + duration
+_ID_STRUCT = struct.Struct("<QQ")  # magic + test_id (PEER_ACK, PEER_COMPLETE)
+_TEST_ID_STRUCT = struct.Struct("<Q")  # data message prefix
+
+
 def make_peer_init(timestamp_ns: int, duration_s: int) -> bytes:
     """Create a PEER_INIT payload with nanosecond timestamp and duration."""
-    return (
-        message.uint64_to_bytes(PEER_INIT_MAGIC)
-        + message.uint64_to_bytes(timestamp_ns)
-        + message.uint32_to_bytes(duration_s)
-    )
+    return _INIT_STRUCT.pack(PEER_INIT_MAGIC, timestamp_ns, duration_s)
 
 
 def make_peer_ack(test_id: int) -> bytes:
     """Create a PEER_ACK payload with the agreed test ID."""
-    return message.uint64_to_bytes(PEER_ACK_MAGIC) + message.uint64_to_bytes(test_id)
+    return _ID_STRUCT.pack(PEER_ACK_MAGIC, test_id)
 
 
 def make_peer_complete(test_id: int) -> bytes:
     """Create a PEER_COMPLETE payload with test ID."""
-    return message.uint64_to_bytes(PEER_COMPLETE_MAGIC) + message.uint64_to_bytes(test_id)
+    return _ID_STRUCT.pack(PEER_COMPLETE_MAGIC, test_id)
 
 
 def make_data_msg(test_id: int) -> bytes:
     """Create a data message payload with test ID prefix."""
-    return message.uint64_to_bytes(test_id) + message.random_payload()
+    return _TEST_ID_STRUCT.pack(test_id) + message.random_payload()
 
 
 # -----------------------------------------------------------------------------
@@ -109,22 +120,18 @@ def make_data_msg(test_id: int) -> bytes:
 
 
 # Expected payload sizes for exact matching
-_PEER_INIT_SIZE = message.UINT64_SIZE * 2 + message.UINT32_SIZE  # magic + timestamp + duration
-_PEER_ACK_SIZE = message.UINT64_SIZE * 2  # magic + test_id
-_PEER_COMPLETE_SIZE = message.UINT64_SIZE * 2  # magic + test_id
+_PEER_INIT_SIZE = _INIT_STRUCT.size  # magic + timestamp + duration
+_PEER_ACK_SIZE = _ID_STRUCT.size  # magic + test_id
+_PEER_COMPLETE_SIZE = _ID_STRUCT.size  # magic + test_id
 
 
 def parse_peer_init(payload: bytes) -> tuple[int, int] | None:
     """Parse a PEER_INIT payload, returning (timestamp_ns, duration_s) or None."""
     if len(payload) != _PEER_INIT_SIZE:
         return None
-    magic = message.uint64_from_bytes(payload[: message.UINT64_SIZE])
+    magic, timestamp_ns, duration_s = _INIT_STRUCT.unpack_from(payload)
     if magic != PEER_INIT_MAGIC:
         return None
-    timestamp_ns = message.uint64_from_bytes(
-        payload[message.UINT64_SIZE : message.UINT64_SIZE * 2]
-    )
-    duration_s = message.uint32_from_bytes(payload[message.UINT64_SIZE * 2 :])
     return timestamp_ns, duration_s
 
 
@@ -132,20 +139,20 @@ def parse_peer_ack(payload: bytes) -> int | None:
     """Parse a PEER_ACK payload, returning the test ID or None if invalid."""
     if len(payload) != _PEER_ACK_SIZE:
         return None
-    magic = message.uint64_from_bytes(payload[: message.UINT64_SIZE])
+    magic, test_id = _ID_STRUCT.unpack_from(payload)
     if magic != PEER_ACK_MAGIC:
         return None
-    return message.uint64_from_bytes(payload[message.UINT64_SIZE :])
+    return test_id
 
 
 def parse_peer_complete(payload: bytes) -> int | None:
     """Parse a PEER_COMPLETE payload, returning the test ID or None if invalid."""
     if len(payload) != _PEER_COMPLETE_SIZE:
         return None
-    magic = message.uint64_from_bytes(payload[: message.UINT64_SIZE])
+    magic, test_id = _ID_STRUCT.unpack_from(payload)
     if magic != PEER_COMPLETE_MAGIC:
         return None
-    return message.uint64_from_bytes(payload[message.UINT64_SIZE :])
+    return test_id
 
 
 def parse_data_msg(payload: bytes, expected_test_id: int) -> tuple[bytes | None, bool]:
@@ -157,7 +164,7 @@ def parse_data_msg(payload: bytes, expected_test_id: int) -> tuple[bytes | None,
     """
     if len(payload) < message.UINT64_SIZE:
         return None, False
-    msg_test_id = message.uint64_from_bytes(payload[: message.UINT64_SIZE])
+    (msg_test_id,) = _TEST_ID_STRUCT.unpack_from(payload)
     data = payload[message.UINT64_SIZE :]
     return data, msg_test_id == expected_test_id
 
@@ -167,32 +174,56 @@ def parse_data_msg(payload: bytes, expected_test_id: int) -> tuple[bytes | None,
 # -----------------------------------------------------------------------------
 
 
-def classify_test_message(payload: bytes, test_id: int) -> MessageResult:
-    """Classify and validate a received message during test phase."""
-    # Check for PEER_COMPLETE
+def _classify_complete(payload: bytes, test_id: int) -> MessageResult | None:
     complete_test_id = parse_peer_complete(payload)
-    if complete_test_id is not None:
-        if complete_test_id == test_id:
-            return MessageResult.COMPLETE
-        logger.debug("Ignoring PEER_COMPLETE with wrong test_id")
-        return MessageResult.IGNORE
+    if complete_test_id is None:
+        return None
+    if complete_test_id == test_id:
+        return MessageResult.COMPLETE
+    logger.debug("Ignoring PEER_COMPLETE with wrong test_id")
+    return MessageResult.IGNORE
 
-    # Check for PEER_INIT (initiator may not have received ACK)
-    peer_init_result = parse_peer_init(payload)
-    if peer_init_result is not None:
-        return MessageResult.PEER_INIT
 
-    # Ignore stale PEER_ACK
-    if parse_peer_ack(payload) is not None:
-        logger.debug("Ignoring stale PEER_ACK during test")
-        return MessageResult.IGNORE
+def _classify_init(payload: bytes, test_id: int) -> MessageResult | None:
+    # Initiator may not have received ACK
+    if parse_peer_init(payload) is None:
+        return None
+    return MessageResult.PEER_INIT
+
+
+def _classify_ack(payload: bytes, test_id: int) -> MessageResult | None:
+    if parse_peer_ack(payload) is None:
+        return None
+    logger.debug("Ignoring stale PEER_ACK during test")
+    return MessageResult.IGNORE
+
+
+# Control message classifiers keyed by magic; anything else is a data message
+_CONTROL_CLASSIFIERS = {
+    PEER_COMPLETE_MAGIC: _classify_complete,
+    PEER_INIT_MAGIC: _classify_init,
+    PEER_ACK_MAGIC: _classify_ack,
+}
+
+
+def classify_test_message(payload: bytes, test_id: int) -> MessageResult:
+    """Classify and validate a received message during test phase.
 
-    # Parse data message
-    data, matches_test_id = parse_data_msg(payload, test_id)
-    if data is None:
+    The leading 8 bytes are read once: a control magic dispatches to that
+    message's parser, otherwise they are the data message's test ID.
+    """
+    if len(payload) < message.UINT64_SIZE:
         logger.debug("Ignoring malformed data message")
         return MessageResult.IGNORE
-    if not matches_test_id:
+
+    (prefix,) = _TEST_ID_STRUCT.unpack_from(payload)
+    classifier = _CONTROL_CLASSIFIERS.get(prefix)
+    if classifier is not None:
+        result = classifier(payload, test_id)
+        if result is not None:
+            return result
+
+    if prefix != test_id:
         logger.debug("Ignoring data message with wrong test_id")
         return MessageResult.IGNORE
 
@@ -243,42 +274,42 @@ def establish_peer(
         if payload is None:
             continue
 
-        # Check for PEER_INIT from peer
-        peer_init_result = parse_peer_init(payload)
-        if peer_init_result is not None and peer_timestamp_ns is None:
-            their_ts, their_duration = peer_init_result
-            peer_timestamp_ns = their_ts
-            # Earlier timestamp wins
-            if our_timestamp_ns < their_ts:
-                is_initiator = True
-                test_id = make_test_id(our_timestamp_ns)
-                logger.info(
-                    f"Peer detected (initiator, test_id={test_id:016x}, "
-                    f"duration: {duration_s}s)"
-                )
-                # Continue to wait for PEER_ACK
-            else:
-                # Responder uses initiator's duration
-                is_initiator = False
-                test_id = make_test_id(their_ts)
-                logger.info(
-                    f"Peer detected (responder, test_id={test_id:016x}, "
-                    f"test duration: {their_duration}s)"
-                )
-                # Flush buffers and send PEER_ACK, then we're done
-                dev.flush_buffers()
-                dev.write_msg(make_peer_ack(test_id))
-                return PeerInfo(
-                    is_initiator=False,
-                    test_id=test_id,
-                    duration_s=their_duration,  # Use initiator's duration
-                    peer_timestamp_ns=their_ts,
-                )
-            continue
+        # Check for PEER_INIT from peer (only until roles are decided)
+        if peer_timestamp_ns is None:
+            peer_init_result = parse_peer_init(payload)
+            if peer_init_result is not None:
+                their_ts, their_duration = peer_init_result
+                peer_timestamp_ns = their_ts
+                # Earlier timestamp wins
+                if our_timestamp_ns < their_ts:
+                    is_initiator = True
+                    test_id = make_test_id(our_timestamp_ns)
+                    logger.info(
+                        f"Peer detected (initiator, test_id={test_id:016x}, "
+                        f"duration: {duration_s}s)"
+                    )
+                    # Continue to wait for PEER_ACK
+                else:
+                    # Responder uses initiator's duration
+                    is_initiator = False
+                    test_id = make_test_id(their_ts)
+                    logger.info(
+                        f"Peer detected (responder, test_id={test_id:016x}, "
+                        f"test duration: {their_duration}s)"
+                    )
+                    # Flush buffers and send PEER_ACK, then we're done
+                    dev.flush_buffers()
+                    dev.write_msg(make_peer_ack(test_id))
+                    return PeerInfo(
+                        is_initiator=False,
+                        test_id=test_id,
+                        duration_s=their_duration,  # Use initiator's duration
+                        peer_timestamp_ns=their_ts,
+                    )
+                continue
 
         # Check for PEER_ACK (only initiator expects this)
-        ack_test_id = parse_peer_ack(payload)
-        if ack_test_id is not None and is_initiator and ack_test_id == test_id:
+        if is_initiator and parse_peer_ack(payload) == test_id:
             # Don't flush here - responder may have already sent test data
             # that would be discarded. Accept some stale PEER_INIT messages
             # in the test loop (they'll be classified and handled).
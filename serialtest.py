@@ -6,12 +6,40 @@ This is a thin entrypoint that delegates to client/server runners.
 
 import argparse
 import logging
+import os
 import sys
 
 from client.runner import run_client
+
+# common.protocol registers the TRACE level name, so it must be imported
+# before SERIAL_LOG_LEVEL is resolved
+from common.protocol import MAX_PIPELINE_DEPTH, TRACE
 from server.runner import run_server
 
-logging.basicConfig(level=logging.DEBUG)
+
+def _log_level_from_env() -> int:
+    """Return the level named by SERIAL_LOG_LEVEL, falling back to DEBUG."""
+    value = os.environ.get("SERIAL_LOG_LEVEL", "DEBUG").strip().upper()
+    if value.isdigit():
+        return int(value)
+    # getLevelName maps a registered name to its number and anything else to a str
+    level = logging.getLevelName(value)
+    if not isinstance(level, int):
+        valid = ", ".join(
+            logging.getLevelName(n)
+            for n in (TRACE, logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR)
+        )
+        print(
+            f"serialtest: unknown SERIAL_LOG_LEVEL {value!r} (expected {valid} "
+            "or a number), using DEBUG",
+            file=sys.stderr,
+        )
+        return logging.DEBUG
+    return level
+
+
+# Raise to INFO or WARNING for throughput runs; TRACE logs every message
+logging.basicConfig(level=_log_level_from_env())
 logger = logging.getLogger(__name__)
 
 DEFAULT_BAUDRATE = 115200
@@ -70,6 +98,16 @@ Client initiates peering and exits.
         default=DEFAULT_MSG_COUNT,
         help=f"Message count for session test (client only, default: {DEFAULT_MSG_COUNT})",
     )
+    parser.add_argument(
+        "-p",
+        "--pipeline-depth",
+        type=int,
+        default=1,
+        help=(
+            "Messages sent per write before reading their responses "
+            f"(client only, 1-{MAX_PIPELINE_DEPTH}, default: 1)"
+        ),
+    )
     parser.add_argument(
         "-w",
         "--handshake-timeout",
@@ -80,10 +118,19 @@ Client initiates peering and exits.
     parser.add_argument(
         "--no-latency-fix",
         action="store_true",
-        help="Disable automatic FTDI latency timer configuration",
+        help="Disable automatic FTDI latency timer and low-latency tty configuration",
+    )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Run under SCHED_FIFO realtime scheduling to reduce latency jitter (Linux, needs root)",
     )
 
     args = parser.parse_args()
+    if not 1 <= args.pipeline_depth <= MAX_PIPELINE_DEPTH:
+        # A deeper burst may not fit in the tty transmit buffer and could
+        # outlast the port's write timeout
+        parser.error(f"--pipeline-depth must be between 1 and {MAX_PIPELINE_DEPTH}")
 
     logger.info(f"Serial device: {args.device}, role={args.role}")
 
@@ -98,6 +145,8 @@ Client initiates peering and exits.
             handshake_timeout_s=args.handshake_timeout,
             msg_count=args.msg_count,
             no_latency_fix=args.no_latency_fix,
+            pipeline_depth=args.pipeline_depth,
+            realtime=args.realtime,
         )
     else:
         return run_server(
@@ -105,6 +154,7 @@ Client initiates peering and exits.
             baudrate=args.baudrate,
             rtscts=rtscts,
             no_latency_fix=args.no_latency_fix,
+            realtime=args.realtime,
         )
 
 
@@ -12,12 +12,11 @@ import time
 from common.connection import Connection, PeeringError, Role, SessionParams
 from common.encoding import (
     EncodingError,
-    TransportError,
     decode_ack_with_params,
-    decode_message,
     encode_control,
+    try_decode_message,
 )
-from common.io import drain_input
+from common.io import drain_input, wait_readable
 from common.protocol import (
     DEFAULT_ACK_TIMEOUT_S,
     DEFAULT_CLIENT_TIMEOUT_S,
@@ -39,14 +38,16 @@ def server_wait_for_syn(
     Raises PeeringError on timeout.
     Note: Caller should drain_input() before calling if needed.
     """
-    start = time.monotonic()
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout_s
 
-    while time.monotonic() - start < timeout_s:
-        try:
-            msg_type, recv_id, _, crc_ok = decode_message(port)
-        except (TransportError, EncodingError):
+    while (now := monotonic()) < deadline:
+        # Sleep until data arrives instead of spinning on timed-out reads
+        if not wait_readable(port, deadline - now):
             continue
 
+        msg_type, recv_id, _, crc_ok = try_decode_message(port)
+
         if msg_type == MsgType.SYN and crc_ok:
             logger.info(f"Server: received SYN (id={recv_id.hex()})")
             return recv_id
@@ -66,21 +67,23 @@ def server_send_syn_ack_wait_ack(
     Raises PeeringError on timeout or missing session params.
     """
     syn_ack_msg = encode_control(MsgType.SYN_ACK, conn_id)
-    start = time.monotonic()
-    last_syn_ack = 0.0
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout_s
+    next_syn_ack = 0.0
 
-    while time.monotonic() - start < timeout_s:
+    while (now := monotonic()) < deadline:
         # Retransmit SYN_ACK periodically (client may have missed it)
-        if time.monotonic() - last_syn_ack > syn_ack_interval_s:
+        if now >= next_syn_ack:
             port.write(syn_ack_msg)
-            last_syn_ack = time.monotonic()
+            next_syn_ack = now + syn_ack_interval_s
             logger.debug("Server: sent SYN_ACK")
 
-        try:
-            msg_type, recv_id, data, crc_ok = decode_message(port)
-        except (TransportError, EncodingError):
+        # Sleep until data arrives or the next SYN_ACK is due
+        if not wait_readable(port, max(0.0, min(next_syn_ack, deadline) - now)):
             continue
 
+        msg_type, recv_id, data, crc_ok = try_decode_message(port)
+
         if msg_type == MsgType.ACK and recv_id == conn_id and crc_ok:
             # Decode session params from ACK payload (required)
             # The full payload is: [type][conn_id][session_params...]
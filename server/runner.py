@@ -12,39 +12,59 @@ from types import FrameType
 from common.connection import PeeringError, Role
 from common.device import configure_ftdi_latency_timer, open_serial
 from common.report import PeeringReport
+from common.sched import enable_realtime_scheduling
 from server.handshake import server_handshake
 from session.exchange import server_exchange
 from session.report import SessionReport
 
 logger = logging.getLogger(__name__)
 
-# Short timeout for handshake polling - allows quick response to shutdown signals
+# Handshake attempt length; each attempt re-drains stale input from the port
 HANDSHAKE_POLL_S = 1.0
 
 
+class _ShutdownRequested(BaseException):
+    """Raised by the signal handler to break out of a blocking wait.
+
+    Derives from BaseException, like KeyboardInterrupt, so the generic
+    ``except Exception`` handlers it passes through cannot swallow it.
+    """
+
+    pass
+
+
 def run_server(
     device: str,
     baudrate: int,
     rtscts: bool,
     no_latency_fix: bool = False,
+    realtime: bool = False,
 ) -> int:
     """Run server in persistent loop. Returns 0 unless crash.
 
     The server:
     - Waits for client connections
-    - Handles SIGINT/SIGTERM for immediate graceful exit
+    - Handles SIGINT/SIGTERM for immediate graceful exit; while waiting for
+      a client the handler raises, so blocking reads and select() calls are
+      interrupted instead of running to their timeout
     - Returns to peering mode after each session completes
     """
     running = True
     in_session = False
+    # Only raise from the handler inside the main loop's try; before that
+    # (startup) and after it (closing the port) clearing running is enough
+    armed = False
 
     def handle_signal(_sig: int, _frame: FrameType | None) -> None:
         nonlocal running
+        was_running = running
         running = False
         if in_session:
             logger.warning("Signal received during session - exiting early")
         else:
             logger.info("Signal received - shutting down")
+            if armed and was_running:
+                raise _ShutdownRequested
 
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
@@ -53,8 +73,11 @@ def run_server(
     if not no_latency_fix:
         configure_ftdi_latency_timer(device)
 
+    if realtime:
+        enable_realtime_scheduling()
+
     try:
-        ser = open_serial(device, baudrate, rtscts)
+        ser = open_serial(device, baudrate, rtscts, low_latency=not no_latency_fix)
     except Exception as e:
         logger.error(f"Failed to open serial port: {e}")
         return 1
@@ -62,6 +85,7 @@ def run_server(
     try:
         logger.info(f"Server started on {device}, waiting for connections...")
 
+        armed = True
         while running:
             # Attempt peering with short timeout to allow quick response to signals
             try:
@@ -103,7 +127,10 @@ def run_server(
             else:
                 logger.warning(f"Session failed: {session_result.error}")
 
+    except _ShutdownRequested:
+        pass
     finally:
+        armed = False
         ser.close()
         logger.info(f"Closed {device}")
 
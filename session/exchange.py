@@ -8,15 +8,20 @@ Contains:
 
 import logging
 import time
+from array import array
 from dataclasses import dataclass, field
 
+import serial
+
 from client.shutdown import client_shutdown
-from common.encoding import EncodingError, TransportError, decode_message
-from common.io import recv_data, send_data
+from common.encoding import EncodingError, TransportError, try_decode_message
+from common.io import recv_data, send_data, send_data_batch, wait_readable
 from common.message import random_payload
 from common.protocol import (
+    DEFAULT_RESPONSE_TIMEOUT_S,
     FIN_WAIT_TIMEOUT_S,
     LOG_PROGRESS_INTERVAL,
+    MAX_PIPELINE_DEPTH,
     MsgType,
     SerialPort,
     TRACE,
@@ -31,7 +36,7 @@ from session.result import SessionError, SessionResult
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class _SessionStats:
     """Internal stats accumulator during exchange."""
 
@@ -41,22 +46,32 @@ class _SessionStats:
     crc_errors: int = 0
     bytes_sent: int = 0
     bytes_received: int = 0
-    rtt_samples: list[float] = field(default_factory=list)
+    # Unboxed doubles: appending a sample allocates no float object
+    rtt_samples: "array[float]" = field(default_factory=lambda: array("d"))
     elapsed_s: float = 0.0
 
-
-def _stats_to_dict(stats: _SessionStats) -> dict:
-    """Convert _SessionStats to dict for SessionResult unpacking."""
-    return {
-        "sent": stats.sent,
-        "received": stats.received,
-        "crc_ok": stats.crc_ok,
-        "crc_errors": stats.crc_errors,
-        "bytes_sent": stats.bytes_sent,
-        "bytes_received": stats.bytes_received,
-        "rtt_samples": stats.rtt_samples,
-        "elapsed_s": stats.elapsed_s,
-    }
+    def to_result(
+        self,
+        success: bool,
+        error: Exception | None = None,
+        fin_ack_received: bool = False,
+        fin_received: bool = False,
+    ) -> SessionResult:
+        """Build the SessionResult for these stats."""
+        return SessionResult(
+            success=success,
+            sent=self.sent,
+            received=self.received,
+            crc_ok=self.crc_ok,
+            crc_errors=self.crc_errors,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            rtt_samples=self.rtt_samples,
+            elapsed_s=self.elapsed_s,
+            error=error,
+            fin_ack_received=fin_ack_received,
+            fin_received=fin_received,
+        )
 
 
 def wait_for_fin(
@@ -74,14 +89,15 @@ def wait_for_fin(
     Returns:
         True if FIN received with matching conn_id, False on timeout.
     """
-    start = time.monotonic()
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout_s
 
-    while time.monotonic() - start < timeout_s:
-        try:
-            msg_type, recv_id, _, crc_ok = decode_message(port)
-        except (TransportError, EncodingError):
+    while (now := monotonic()) < deadline:
+        if not wait_readable(port, deadline - now):
             continue
 
+        msg_type, recv_id, _, crc_ok = try_decode_message(port)
+
         if msg_type == MsgType.FIN and recv_id == conn.connection_id and crc_ok:
             logger.debug("Received FIN from peer")
             return True
@@ -104,6 +120,7 @@ def _handle_client_data_response(
     rtt_start: float,
     msg_index: int,
     msg_count: int,
+    trace_on: bool,
 ) -> None:
     """Handle DATA response from server, updating stats and RTT."""
     stats.received += 1
@@ -114,9 +131,11 @@ def _handle_client_data_response(
         stats.crc_ok += 1
         rtt = time.monotonic() - rtt_start
         stats.rtt_samples.append(rtt)
-        logger.log(
-            TRACE, f"Client: received response {msg_index + 1}/{msg_count} (RTT={rtt * 1000:.2f}ms)"
-        )
+        if trace_on:
+            logger.log(
+                TRACE,
+                f"Client: received response {msg_index + 1}/{msg_count} (RTT={rtt * 1000:.2f}ms)",
+            )
         # Periodic progress logging
         if (msg_index + 1) % LOG_PROGRESS_INTERVAL == 0:
             logger.debug(f"Client: progress {msg_index + 1}/{msg_count} (RTT={rtt * 1000:.2f}ms)")
@@ -132,10 +151,9 @@ def _handle_client_server_fin(
     """Handle unexpected FIN from server during exchange."""
     stats.elapsed_s = time.monotonic() - start
     logger.warning("Client: server sent FIN during exchange")
-    return SessionResult(
+    return stats.to_result(
         success=False,
         error=SessionError("Server sent FIN during exchange"),
-        **_stats_to_dict(stats),
     )
 
 
@@ -143,20 +161,37 @@ def client_exchange(
     port: SerialPort,
     conn: Connection,
     msg_count: int,
+    pipeline_depth: int = 1,
 ) -> SessionResult:
     """Client-side data exchange.
 
     Sends msg_count DATA messages, waits for echo response to each,
     measures RTT for latency statistics.
 
+    With pipeline_depth > 1, messages are sent in bursts of up to that many
+    frames with a single write, then the burst's responses are read. Each
+    RTT is measured from the start of its burst, so it includes time spent
+    queued behind earlier frames. Keep pipeline_depth within
+    MAX_PIPELINE_DEPTH so a burst fits in the tty transmit buffer; a write
+    that still times out ends the session with a failed result.
+
     Args:
         port: Serial port for communication.
         conn: Established connection from peering.
         msg_count: Number of request-response rounds.
+        pipeline_depth: Messages sent per write before reading responses.
 
     Returns:
         SessionResult with exchange statistics.
+
+    Raises:
+        ValueError: If pipeline_depth is outside 1..MAX_PIPELINE_DEPTH.
     """
+    if not 1 <= pipeline_depth <= MAX_PIPELINE_DEPTH:
+        raise ValueError(
+            f"pipeline_depth must be between 1 and {MAX_PIPELINE_DEPTH}, got {pipeline_depth}"
+        )
+
     stats = _SessionStats()
     start = time.monotonic()
 
@@ -167,41 +202,64 @@ def client_exchange(
         logger.info("Client: msg_count=0, skipping exchange")
         stats.elapsed_s = time.monotonic() - start
         fin_ack = client_shutdown(port, conn)
-        return SessionResult(
+        return stats.to_result(
             success=True,
             fin_ack_received=fin_ack,
-            **_stats_to_dict(stats),
         )
 
-    for i in range(msg_count):
-        # Generate random payload
-        payload = random_payload()
+    # Checked once so disabled TRACE messages are never formatted
+    trace_on = logger.isEnabledFor(TRACE)
+    monotonic = time.monotonic
+    fin = MsgType.FIN
+    for burst_start in range(0, msg_count, pipeline_depth):
+        burst = range(burst_start, min(burst_start + pipeline_depth, msg_count))
 
-        # Send DATA and start RTT timer
-        rtt_start = time.monotonic()
-        bytes_written = send_data(port, conn, payload)
-        if bytes_written:
-            stats.sent += 1
-            stats.bytes_sent += bytes_written
-            logger.log(TRACE, f"Client: sent message {i + 1}/{msg_count} ({len(payload)} bytes)")
+        # Generate random payloads
+        payloads = [random_payload() for _ in burst]
 
-        # Wait for echo response
+        # Send DATA and start RTT timer
+        rtt_start = monotonic()
         try:
-            response, crc_ok, msg_type = recv_data(port, conn)
-        except (TransportError, EncodingError, ConnectionMismatchError):
-            stats.elapsed_s = time.monotonic() - start
-            logger.error(f"Client: timeout waiting for response to message {i + 1}")
-            return SessionResult(
+            if len(payloads) == 1:
+                bytes_written = send_data(port, conn, payloads[0])
+            else:
+                bytes_written = send_data_batch(port, conn, payloads)
+        except serial.SerialTimeoutException:
+            stats.elapsed_s = monotonic() - start
+            logger.error(f"Client: write timeout sending message {burst.start + 1}")
+            return stats.to_result(
                 success=False,
-                error=SessionError(f"Timeout waiting for response to message {i + 1}"),
-                **_stats_to_dict(stats),
+                error=SessionError(f"Write timeout sending message {burst.start + 1}"),
             )
-
-        match msg_type:
-            case MsgType.DATA:
-                _handle_client_data_response(stats, response, crc_ok, rtt_start, i, msg_count)
-            case MsgType.FIN:
+        if bytes_written:
+            stats.sent += len(payloads)
+            stats.bytes_sent += bytes_written
+            if trace_on:
+                for i, payload in zip(burst, payloads):
+                    logger.log(
+                        TRACE, f"Client: sent message {i + 1}/{msg_count} ({len(payload)} bytes)"
+                    )
+
+        # Wait for echo responses
+        for i in burst:
+            try:
+                response, crc_ok, msg_type = recv_data(
+                    port, conn, timeout_s=DEFAULT_RESPONSE_TIMEOUT_S
+                )
+            except (TransportError, EncodingError, ConnectionMismatchError):
+                stats.elapsed_s = monotonic() - start
+                logger.error(f"Client: timeout waiting for response to message {i + 1}")
+                return stats.to_result(
+                    success=False,
+                    error=SessionError(f"Timeout waiting for response to message {i + 1}"),
+                )
+
+            # recv_data only returns DATA or FIN
+            if msg_type is fin:
                 return _handle_client_server_fin(stats, start)
+            _handle_client_data_response(
+                stats, response, crc_ok, rtt_start, i, msg_count, trace_on
+            )
 
     stats.elapsed_s = time.monotonic() - start
     logger.info(
@@ -213,10 +271,9 @@ def client_exchange(
     logger.info("Client: initiating shutdown")
     fin_ack = client_shutdown(port, conn)
 
-    return SessionResult(
+    return stats.to_result(
         success=True,
         fin_ack_received=fin_ack,
-        **_stats_to_dict(stats),
     )
 
 
@@ -233,6 +290,7 @@ def _handle_server_data(
     crc_ok: bool,
     msg_index: int,
     msg_count: int,
+    trace_on: bool,
 ) -> None:
     """Handle DATA message from client, update stats and echo back."""
     stats.received += 1
@@ -241,7 +299,8 @@ def _handle_server_data(
 
     if crc_ok:
         stats.crc_ok += 1
-        logger.log(TRACE, f"Server: received message {msg_index + 1}/{msg_count}")
+        if trace_on:
+            logger.log(TRACE, f"Server: received message {msg_index + 1}/{msg_count}")
     else:
         stats.crc_errors += 1
         logger.warning(f"Server: CRC error on message {msg_index + 1}/{msg_count}")
@@ -252,7 +311,8 @@ def _handle_server_data(
     if bytes_written:
         stats.sent += 1
         stats.bytes_sent += bytes_written
-        logger.log(TRACE, f"Server: sent echo {msg_index + 1}/{msg_count}")
+        if trace_on:
+            logger.log(TRACE, f"Server: sent echo {msg_index + 1}/{msg_count}")
         # Periodic progress logging
         if (msg_index + 1) % LOG_PROGRESS_INTERVAL == 0:
             logger.debug(f"Server: progress {msg_index + 1}/{msg_count}")
@@ -268,11 +328,10 @@ def _handle_server_client_fin(
     stats.elapsed_s = time.monotonic() - start
     logger.warning(f"Server: client sent FIN after {stats.received} messages")
     server_shutdown(port, conn)
-    return SessionResult(
+    return stats.to_result(
         success=False,
         error=SessionError(f"Client sent FIN after {stats.received} messages"),
         fin_received=True,
-        **_stats_to_dict(stats),
     )
 
 
@@ -305,30 +364,29 @@ def server_exchange(
         fin_received = wait_for_fin(port, conn, timeout_s=FIN_WAIT_TIMEOUT_S)
         if fin_received:
             server_shutdown(port, conn)
-        return SessionResult(
+        return stats.to_result(
             success=True,
             fin_received=fin_received,
-            **_stats_to_dict(stats),
         )
 
+    trace_on = logger.isEnabledFor(TRACE)
+    fin = MsgType.FIN
     for i in range(msg_count):
         # Wait for client DATA
         try:
-            data, crc_ok, msg_type = recv_data(port, conn)
+            data, crc_ok, msg_type = recv_data(port, conn, timeout_s=DEFAULT_RESPONSE_TIMEOUT_S)
         except (TransportError, EncodingError, ConnectionMismatchError):
             stats.elapsed_s = time.monotonic() - start
             logger.error(f"Server: timeout waiting for message {i + 1}")
-            return SessionResult(
+            return stats.to_result(
                 success=False,
                 error=SessionError(f"Timeout waiting for message {i + 1}"),
-                **_stats_to_dict(stats),
             )
 
-        match msg_type:
-            case MsgType.DATA:
-                _handle_server_data(port, conn, stats, data, crc_ok, i, msg_count)
-            case MsgType.FIN:
-                return _handle_server_client_fin(port, conn, stats, start)
+        # recv_data only returns DATA or FIN
+        if msg_type is fin:
+            return _handle_server_client_fin(port, conn, stats, start)
+        _handle_server_data(port, conn, stats, data, crc_ok, i, msg_count, trace_on)
 
     stats.elapsed_s = time.monotonic() - start
     logger.info(
@@ -344,8 +402,7 @@ def server_exchange(
     else:
         logger.warning("Server: FIN timeout, closing anyway")
 
-    return SessionResult(
+    return stats.to_result(
         success=True,
         fin_received=fin_received,
-        **_stats_to_dict(stats),
     )
@@ -7,6 +7,7 @@ Contains:
 - SessionResult: Result from session data exchange
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 
@@ -16,7 +17,7 @@ class SessionError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class LatencyStats:
     """Computed latency statistics in milliseconds."""
 
@@ -29,11 +30,11 @@ class LatencyStats:
     p99_ms: float
 
 
-def compute_latency_stats(rtt_samples: list[float]) -> LatencyStats | None:
+def compute_latency_stats(rtt_samples: Sequence[float]) -> LatencyStats | None:
     """Compute latency statistics from RTT samples (in seconds).
 
     Args:
-        rtt_samples: List of round-trip times in seconds.
+        rtt_samples: Round-trip times in seconds.
 
     Returns:
         LatencyStats with percentiles in milliseconds, or None if empty.
@@ -42,24 +43,23 @@ def compute_latency_stats(rtt_samples: list[float]) -> LatencyStats | None:
         return None
 
     count = len(rtt_samples)
-    samples_ms = sorted(s * 1000 for s in rtt_samples)
-
-    def percentile(sorted_data: list[float], p: float) -> float:
-        idx = int(p / 100 * (len(sorted_data) - 1))
-        return sorted_data[idx]
+    # Sort the raw seconds once and scale only the values reported, rather
+    # than building a second list of every sample in milliseconds
+    ordered = sorted(rtt_samples)
+    last = count - 1
 
     return LatencyStats(
         count=count,
-        min_ms=samples_ms[0],
-        max_ms=samples_ms[-1],
-        avg_ms=sum(samples_ms) / count,
-        p50_ms=percentile(samples_ms, 50),
-        p95_ms=percentile(samples_ms, 95),
-        p99_ms=percentile(samples_ms, 99),
+        min_ms=ordered[0] * 1000,
+        max_ms=ordered[-1] * 1000,
+        avg_ms=sum(ordered) / count * 1000,
+        p50_ms=ordered[int(0.50 * last)] * 1000,
+        p95_ms=ordered[int(0.95 * last)] * 1000,
+        p99_ms=ordered[int(0.99 * last)] * 1000,
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionResult:
     """Result from session data exchange.
 
@@ -85,7 +85,7 @@ class SessionResult:
     crc_errors: int = 0
     bytes_sent: int = 0
     bytes_received: int = 0
-    rtt_samples: list[float] = field(default_factory=list)
+    rtt_samples: Sequence[float] = field(default_factory=list)
     elapsed_s: float = 0.0
     error: Exception | None = None
     fin_ack_received: bool = False
@@ -2,6 +2,9 @@
 
 Provides:
 - MockSerialPort: Single-buffer mock for simple unit tests
+- EchoingMockPort: Loopback mock that answers FIN with FIN_ACK
+- WriteTimeoutMockPort: Mock whose writes fail like a stalled serial port
+- RecordingMockPort: Mock that records when each write happened
 - ConnectedMockPorts: Bidirectional mock pair for timeout/exchange tests
 - socat PTY pair fixture for integration tests
 - Markers for unit vs integration tests
@@ -17,6 +20,10 @@ from collections.abc import Generator
 from pathlib import Path
 
 import pytest
+import serial
+
+from common.encoding import encode_control
+from common.protocol import MsgType
 
 
 class MockSerialPort:
@@ -60,6 +67,57 @@ class MockSerialPort:
         """Inject data into the buffer as if received from peer."""
         self.write(data)
 
+    def reset_input_buffer(self) -> None:
+        """Discard all unread data."""
+        with self._lock:
+            self._read_pos = self._buffer.seek(0, 2)
+
+    def close(self) -> None:
+        """No-op so the mock can stand in for an opened port."""
+
+
+class EchoingMockPort(MockSerialPort):
+    """Loopback mock port that answers FIN with FIN_ACK and counts writes.
+
+    DATA frames are read back unchanged, standing in for the server echo,
+    so a client exchange can run to completion on a single port.
+    """
+
+    def __init__(self, conn_id: bytes) -> None:
+        super().__init__()
+        self.writes = 0
+        self._fin = encode_control(MsgType.FIN, conn_id)
+        self._fin_ack = encode_control(MsgType.FIN_ACK, conn_id)
+
+    def write(self, data: bytes) -> int:
+        self.writes += 1
+        if data == self._fin:
+            return super().write(self._fin_ack)
+        return super().write(data)
+
+
+class WriteTimeoutMockPort(MockSerialPort):
+    """Mock serial port whose writes time out, like a stalled UART."""
+
+    def write(self, data: bytes) -> int:
+        raise serial.SerialTimeoutException("Write timeout")
+
+
+class RecordingMockPort(MockSerialPort):
+    """Mock serial port that timestamps writes and never has input.
+
+    Written data is discarded rather than looped back, so retransmit loops
+    run undisturbed until their timeout.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.write_times: list[float] = []
+
+    def write(self, data: bytes) -> int:
+        self.write_times.append(time.monotonic())
+        return len(data)
+
 
 class ConnectedMockPorts:
     """Bidirectional mock port pair for testing client-server communication.
@@ -0,0 +1,115 @@
+"""Unit tests for serial device setup."""
+
+import io
+import logging
+from collections.abc import Callable
+from unittest import mock
+
+import pytest
+
+from common import device
+from common.device import (
+    MIN_READ_TIMEOUT_S,
+    configure_ftdi_latency_timer,
+    enable_low_latency,
+    open_serial,
+    read_timeout_for,
+)
+
+
+def _read_only_sysfs(contents: str) -> Callable[..., io.StringIO]:
+    """Return an open() stand-in for a latency_timer file only root may write."""
+
+    def fake_open(path: str, mode: str = "r") -> io.StringIO:
+        if mode != "r":
+            raise PermissionError(13, "Permission denied", path)
+        return io.StringIO(contents)
+
+    return fake_open
+
+
+@pytest.mark.unit
+class TestReadTimeout:
+    """Tests for the baud-derived read timeout."""
+
+    def test_115200(self) -> None:
+        # 2 * 288 bytes * 10 bits / 115200 baud
+        assert read_timeout_for(115200) == pytest.approx(0.05)
+
+    def test_9600(self) -> None:
+        assert read_timeout_for(9600) == pytest.approx(0.6)
+
+    def test_fast_rate_uses_floor(self) -> None:
+        assert read_timeout_for(921600) == MIN_READ_TIMEOUT_S == 0.01
+
+
+@pytest.mark.unit
+class TestFtdiLatencyTimerPermissionDenied:
+    """Tests for the read-only fallback when the timer cannot be written."""
+
+    def test_already_correct_value_succeeds(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(device, "open", _read_only_sysfs("1\n"), raising=False)
+        assert configure_ftdi_latency_timer("/dev/ttyUSB0") is True
+
+    def test_wrong_value_warns(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.setattr(device, "open", _read_only_sysfs("16\n"), raising=False)
+        with caplog.at_level(logging.WARNING, logger="common.device"):
+            assert configure_ftdi_latency_timer("/dev/ttyUSB0") is False
+        assert "permission denied" in caplog.text
+
+    def test_unparsable_value_warns(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.setattr(device, "open", _read_only_sysfs("garbage"), raising=False)
+        with caplog.at_level(logging.WARNING, logger="common.device"):
+            assert configure_ftdi_latency_timer("/dev/ttyUSB0") is False
+        assert "permission denied" in caplog.text
+
+
+class _LowLatencyPort:
+    """Stub port whose driver accepts or rejects ASYNC_LOW_LATENCY."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls: list[bool] = []
+        self._error = error
+
+    def set_low_latency_mode(self, low_latency_settings: bool) -> None:
+        self.calls.append(low_latency_settings)
+        if self._error is not None:
+            raise self._error
+
+
+@pytest.mark.unit
+class TestEnableLowLatency:
+    """Tests for enable_low_latency() and the open_serial low_latency flag."""
+
+    def test_sets_flag(self) -> None:
+        port = _LowLatencyPort()
+        assert enable_low_latency(port) is True  # type: ignore[arg-type]
+        assert port.calls == [True]
+
+    def test_unsupported_platform_is_noop(self) -> None:
+        # pyserial only defines set_low_latency_mode on POSIX ports
+        assert enable_low_latency(object()) is False  # type: ignore[arg-type]
+
+    def test_driver_rejects_flag(self) -> None:
+        port = _LowLatencyPort(ValueError("Failed to update ASYNC_LOW_LATENCY flag"))
+        assert enable_low_latency(port) is False  # type: ignore[arg-type]
+        assert port.calls == [True]
+
+    @pytest.mark.parametrize("low_latency", [True, False])
+    def test_open_serial_low_latency_flag(self, low_latency: bool) -> None:
+        ser = mock.Mock(baudrate=115200, rtscts=False, timeout=0.05)
+        with (
+            mock.patch("common.device.serial.Serial", return_value=ser),
+            mock.patch("common.device.log_device_info"),
+            mock.patch("common.device.enable_low_latency") as enable,
+        ):
+            open_serial("/dev/ttyUSB0", 115200, low_latency=low_latency)
+
+        if low_latency:
+            enable.assert_called_once_with(ser)
+        else:
+            enable.assert_not_called()
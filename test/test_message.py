@@ -26,6 +26,13 @@ class TestUint32Conversion:
     def test_from_bytes_little_endian(self) -> None:
         assert message.uint32_from_bytes(b"\x04\x03\x02\x01") == 0x01020304
 
+    def test_from_bytes_offset(self) -> None:
+        assert message.uint32_from_bytes(b"\xff\x04\x03\x02\x01\xff", 1) == 0x01020304
+
+    def test_uint64_roundtrip(self) -> None:
+        value = 0x0102030405060708
+        assert message.uint64_from_bytes(message.uint64_to_bytes(value)) == value
+
 
 @pytest.mark.unit
 class TestEncodeDecode:
@@ -80,6 +87,12 @@ class TestEncodeDecode:
         assert decoded is None
         assert not ok
 
+    def test_decode_rejects_length_below_min(self) -> None:
+        reader = io.BytesIO(message.encode(b"abc"))
+        decoded, ok = message.decode(reader, min_length=5)
+        assert decoded is None
+        assert not ok
+
     def test_decode_corrupted_crc(self) -> None:
         payload = b"hello"
         encoded = bytearray(message.encode(payload))
@@ -92,6 +105,41 @@ class TestEncodeDecode:
         assert not ok
 
 
+@pytest.mark.unit
+class TestResync:
+    """Test resynchronization on misaligned streams."""
+
+    def test_resync_after_junk(self) -> None:
+        payload = b"hello"
+        reader = io.BytesIO(b"junk bytes" + message.encode(payload))
+        decoded, ok = message.decode(reader)
+        assert ok
+        assert decoded == payload
+
+    def test_resync_after_partial_magic(self) -> None:
+        # Junk ending in a prefix of the sync magic must not hide the real one
+        payload = b"hello"
+        junk = b"\x00" * 7 + message.SYNC_MAGIC_BYTES[:3]
+        reader = io.BytesIO(junk + message.encode(payload))
+        decoded, ok = message.decode(reader)
+        assert ok
+        assert decoded == payload
+
+    def test_resync_preserves_following_frames(self) -> None:
+        # Bulk scanning must not consume bytes belonging to the next frame
+        first = message.encode(b"")
+        second = message.encode(b"second")
+        reader = io.BytesIO(b"\xff" * 5 + first + second)
+        assert message.decode(reader) == (b"", True)
+        assert message.decode(reader) == (b"second", True)
+
+    def test_resync_gives_up_on_garbage(self) -> None:
+        reader = io.BytesIO(b"\x00" * (message.MAX_RESYNC_BYTES + 64))
+        decoded, ok = message.decode(reader)
+        assert decoded is None
+        assert not ok
+
+
 @pytest.mark.unit
 class TestRandomPayload:
     """Test random payload generation."""
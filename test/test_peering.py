@@ -1,5 +1,7 @@
 """Unit tests for the peering module."""
 
+import time
+
 import pytest
 
 from client.handshake import (
@@ -19,16 +21,18 @@ from common.encoding import (
     encode_control,
     encode_data,
     generate_connection_id,
+    try_decode_message,
 )
-from common.io import drain_input, recv_data, send_data
+from common.io import BufferedSerial, drain_input, recv_data, send_data, wait_readable
 from common.protocol import MsgType
+from peering import make_test_id
 from server.handshake import (
     server_handshake,
     server_send_syn_ack_wait_ack,
     server_wait_for_syn,
 )
 from server.shutdown import server_shutdown
-from test.conftest import MockSerialPort
+from test.conftest import MockSerialPort, RecordingMockPort
 
 
 @pytest.mark.unit
@@ -72,6 +76,12 @@ class TestEncoding:
             assert data == b""  # Control messages have no data
             assert crc_ok is True
 
+    def test_encode_control_matches_generic_encoding(self) -> None:
+        conn_id = b"\x10\x20\x30\x40"
+        for msg_type in MsgType:
+            expected = message.encode(bytes([msg_type]) + conn_id)
+            assert encode_control(msg_type, conn_id) == expected
+
     def test_encode_data_roundtrip(self) -> None:
         conn_id = b"\x11\x22\x33\x44"
         payload = b"Hello, world!"
@@ -109,6 +119,92 @@ class TestDrainInput:
         assert port.in_waiting == 0
 
 
+@pytest.mark.unit
+class TestWaitReadable:
+    """Tests for wait_readable function."""
+
+    def test_readable_with_data(self) -> None:
+        port = MockSerialPort()
+        port.inject(b"data")
+        assert wait_readable(port, 1.0) is True
+
+    def test_not_readable_when_empty(self) -> None:
+        port = MockSerialPort()
+        assert wait_readable(port, 0.05) is False
+
+
+@pytest.mark.unit
+class TestBufferedSerial:
+    """Tests for BufferedSerial wrapper."""
+
+    def test_frame_decoded_with_single_port_read(self) -> None:
+        port = MockSerialPort()
+        port.inject(encode_data(b"\x01\x02\x03\x04", b"payload"))
+        reads: list[int] = []
+        raw_read = port.read
+
+        def counting_read(size: int = 1, /) -> bytes:
+            reads.append(size)
+            return raw_read(size)
+
+        port.read = counting_read  # type: ignore[method-assign]
+        buffered = BufferedSerial(port)
+
+        msg_type, recv_id, data, crc_ok = decode_message(buffered)
+        assert (msg_type, recv_id, data, crc_ok) == (MsgType.DATA, b"\x01\x02\x03\x04", b"payload", True)
+        assert len(reads) == 1
+
+    def test_in_waiting_includes_buffered_bytes(self) -> None:
+        port = MockSerialPort()
+        port.inject(b"abcdef")
+        buffered = BufferedSerial(port)
+        assert buffered.read(2) == b"ab"
+        assert port.in_waiting == 0
+        assert buffered.in_waiting == 4
+        assert wait_readable(buffered, 0.0) is True
+
+    def test_drain_clears_buffer(self) -> None:
+        port = MockSerialPort()
+        port.inject(b"stale")
+        buffered = BufferedSerial(port)
+        buffered.read(1)
+        port.inject(b"more")
+        assert drain_input(buffered) == 8
+        assert buffered.in_waiting == 0
+
+    def test_reset_input_buffer_clears_buffer(self) -> None:
+        port = MockSerialPort()
+        port.inject(b"stale")
+        buffered = BufferedSerial(port)
+        buffered.read(1)
+        port.inject(b"more")
+        buffered.reset_input_buffer()
+        assert buffered.in_waiting == 0
+        port.inject(b"fresh")
+        assert buffered.read(5) == b"fresh"
+
+    def test_flush_input_alias_clears_buffer(self) -> None:
+        port = MockSerialPort()
+        port.inject(b"stale")
+        buffered = BufferedSerial(port)
+        buffered.read(1)
+        buffered.flushInput()
+        assert buffered.in_waiting == 0
+
+    def test_short_read_returns_available(self) -> None:
+        port = MockSerialPort()
+        port.inject(b"abc")
+        buffered = BufferedSerial(port)
+        assert buffered.read(10) == b"abc"
+        assert buffered.read(1) == b""
+
+    def test_write_and_attributes_pass_through(self) -> None:
+        port = MockSerialPort()
+        buffered = BufferedSerial(port)
+        assert buffered.write(b"xy") == 2
+        assert buffered.inject == port.inject
+
+
 @pytest.mark.unit
 class TestConnectionId:
     """Tests for connection ID generation."""
@@ -301,6 +397,113 @@ class TestShutdown:
         assert port.in_waiting > 0
 
 
+def _write_gaps(port: RecordingMockPort) -> list[float]:
+    """Return the intervals between consecutive writes on the port."""
+    times = port.write_times
+    return [b - a for a, b in zip(times, times[1:])]
+
+
+class _FakeClock:
+    """Monotonic clock that only moves when a wait times out."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def wait_readable(self, _port: object, timeout_s: float) -> bool:
+        self.now += timeout_s
+        return False
+
+
+@pytest.mark.unit
+class TestRetransmitBackoff:
+    """Tests for SYN and FIN retransmit timing."""
+
+    @pytest.fixture(autouse=True)
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+        clock = _FakeClock()
+        monkeypatch.setattr(time, "monotonic", clock.monotonic)
+        monkeypatch.setattr("client.handshake.wait_readable", clock.wait_readable)
+        monkeypatch.setattr("client.shutdown.wait_readable", clock.wait_readable)
+        # Pin jitter to its midpoint so intervals are exact
+        monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
+        return clock
+
+    def test_syn_backoff_doubles_up_to_cap(self) -> None:
+        port = RecordingMockPort()
+        with pytest.raises(HandshakeError):
+            client_send_syn_wait_syn_ack(
+                port,
+                b"\x01\x02\x03\x04",
+                timeout_s=0.75,
+                syn_interval_s=0.05,
+                max_syn_interval_s=0.2,
+            )
+
+        # Sent at 0, 0.05, 0.15, 0.35 and 0.55; the next is due at the deadline
+        assert port.write_times[0] == 0.0
+        assert _write_gaps(port) == pytest.approx([0.05, 0.1, 0.2, 0.2])
+
+    def test_syn_first_interval_respects_cap(self) -> None:
+        port = RecordingMockPort()
+        with pytest.raises(HandshakeError):
+            client_send_syn_wait_syn_ack(
+                port,
+                b"\x01\x02\x03\x04",
+                timeout_s=0.35,
+                syn_interval_s=0.5,
+                max_syn_interval_s=0.1,
+            )
+
+        assert _write_gaps(port) == pytest.approx([0.1, 0.1, 0.1])
+
+    def test_fin_backoff_capped_at_half_timeout(self) -> None:
+        port = RecordingMockPort()
+        conn = Connection(connection_id=b"\x01\x02\x03\x04", role=Role.CLIENT)
+
+        assert client_shutdown(port, conn, timeout_s=1.2) is False
+
+        # 0.5s, then doubled to 1.0s but capped at timeout_s / 2
+        assert port.write_times[0] == 0.0
+        assert _write_gaps(port) == pytest.approx([0.5, 0.6])
+
+    def test_fin_first_interval_capped_for_short_timeout(self) -> None:
+        port = RecordingMockPort()
+        conn = Connection(connection_id=b"\x01\x02\x03\x04", role=Role.CLIENT)
+
+        assert client_shutdown(port, conn, timeout_s=0.5) is False
+
+        # Half the timeout (0.25s), not the 0.5s default first interval
+        assert _write_gaps(port) == pytest.approx([0.25])
+
+
+@pytest.mark.unit
+class TestMakeTestId:
+    """Tests for the test ID derivation both peers must agree on."""
+
+    def test_matches_splitmix64_reference(self) -> None:
+        # Published splitmix64 outputs for seed 0: the finalizer applied to
+        # multiples of the golden-ratio increment
+        golden = 0x9E3779B97F4A7C15
+        assert make_test_id(golden) == 0xE220A8397B1DCDAF
+        assert make_test_id(2 * golden & 0xFFFFFFFFFFFFFFFF) == 0x6E789E6AA1B965F4
+        assert make_test_id(3 * golden & 0xFFFFFFFFFFFFFFFF) == 0x06C45D188009454F
+
+    def test_pinned_timestamps(self) -> None:
+        # Changing these breaks peering between old and new versions
+        assert make_test_id(0) == 0
+        assert make_test_id(1) == 0x5692161D100B05E5
+        assert make_test_id(1_700_000_000_000_000_000) == 0xE4FB33E1E47053FE
+        assert make_test_id(1_760_000_000_123_456_789) == 0x1C94E8630889B807
+
+    def test_result_fits_in_64_bits(self) -> None:
+        timestamp_ns = 1_760_000_000_123_456_789
+        assert make_test_id(timestamp_ns + (1 << 64)) == make_test_id(timestamp_ns)
+        assert 0 <= make_test_id(timestamp_ns) < 1 << 64
+
+
 @pytest.mark.unit
 class TestSessionParams:
     """Tests for ACK with session parameters encoding/decoding."""
@@ -531,6 +734,13 @@ class TestInvalidMessageType:
             decode_message(port)
         assert "Invalid message type" in str(exc_info.value)
 
+    def test_try_decode_invalid_msg_type(self) -> None:
+        """try_decode_message should return the empty sentinel for invalid message type."""
+        port = MockSerialPort()
+        port.inject(message.encode(bytes([0xFF]) + b"\x01\x02\x03\x04"))
+
+        assert try_decode_message(port) == (None, b"", b"", False)
+
 
 @pytest.mark.unit
 class TestEmptyPayloads:
@@ -598,6 +808,14 @@ class TestTruncatedMessages:
         with pytest.raises(TransportError):
             decode_message(port)
 
+    def test_decode_undersized_payload(self) -> None:
+        """decode should raise TransportError for payload shorter than type + conn_id."""
+        port = MockSerialPort()
+        port.inject(message.encode(bytes([MsgType.SYN, 0x01])))
+
+        with pytest.raises(TransportError):
+            decode_message(port)
+
     def test_decode_only_length_field(self) -> None:
         """decode should raise TransportError for message with only length field."""
         port = MockSerialPort()
@@ -607,6 +825,20 @@ class TestTruncatedMessages:
         with pytest.raises(TransportError):
             decode_message(port)
 
+    def test_try_decode_truncated_crc(self) -> None:
+        """try_decode_message should return the empty sentinel instead of raising."""
+        port = MockSerialPort()
+        port.inject(encode_control(MsgType.SYN, b"\x01\x02\x03\x04")[:-2])
+
+        assert try_decode_message(port) == (None, b"", b"", False)
+
+    def test_try_decode_valid(self) -> None:
+        """try_decode_message should match decode_message for valid frames."""
+        port = MockSerialPort()
+        port.inject(encode_data(b"\x01\x02\x03\x04", b"abc"))
+
+        assert try_decode_message(port) == (MsgType.DATA, b"\x01\x02\x03\x04", b"abc", True)
+
 
 @pytest.mark.unit
 class TestHandshakeWithValidThenInvalid:
@@ -0,0 +1,127 @@
+"""Unit tests for realtime scheduling and the --realtime option."""
+
+import logging
+import os
+import signal
+import sys
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+
+import serialtest
+from client.runner import run_client
+from common.sched import REALTIME_PRIORITY, enable_realtime_scheduling
+from server.runner import run_server
+
+requires_sched_fifo = pytest.mark.skipif(
+    not hasattr(os, "SCHED_FIFO"), reason="SCHED_FIFO not available on this platform"
+)
+
+
+@pytest.mark.unit
+class TestEnableRealtimeScheduling:
+    """Tests for each outcome of enable_realtime_scheduling()."""
+
+    @requires_sched_fifo
+    def test_applied(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        calls = []
+        monkeypatch.setattr(os, "sched_setscheduler", lambda *args: calls.append(args))
+
+        with caplog.at_level(logging.INFO, logger="common.sched"):
+            assert enable_realtime_scheduling() is True
+
+        assert calls == [(0, os.SCHED_FIFO, os.sched_param(REALTIME_PRIORITY))]
+        assert "Realtime scheduling enabled" in caplog.text
+
+    def test_unsupported_platform(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.delattr(os, "sched_setscheduler", raising=False)
+
+        with caplog.at_level(logging.WARNING, logger="common.sched"):
+            assert enable_realtime_scheduling() is False
+
+        assert "not supported on this platform" in caplog.text
+
+    @requires_sched_fifo
+    def test_permission_denied(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        def deny(*_args: object) -> None:
+            raise PermissionError(1, "Operation not permitted")
+
+        monkeypatch.setattr(os, "sched_setscheduler", deny)
+
+        with caplog.at_level(logging.WARNING, logger="common.sched"):
+            assert enable_realtime_scheduling() is False
+
+        assert "permission denied" in caplog.text
+
+    @requires_sched_fifo
+    def test_os_error(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        def fail(*_args: object) -> None:
+            raise OSError(22, "Invalid argument")
+
+        monkeypatch.setattr(os, "sched_setscheduler", fail)
+
+        with caplog.at_level(logging.WARNING, logger="common.sched"):
+            assert enable_realtime_scheduling() is False
+
+        assert "Failed to enable realtime scheduling" in caplog.text
+        assert "Invalid argument" in caplog.text
+
+
+@pytest.fixture
+def restore_signal_handlers() -> Generator[None, None, None]:
+    """Restore the SIGINT/SIGTERM handlers run_server installs."""
+    saved = {signum: signal.getsignal(signum) for signum in (signal.SIGINT, signal.SIGTERM)}
+    yield
+    for signum, handler in saved.items():
+        signal.signal(signum, handler)
+
+
+@pytest.mark.unit
+class TestRealtimeOption:
+    """Tests that --realtime reaches enable_realtime_scheduling()."""
+
+    @pytest.mark.parametrize("role", ["client", "server"])
+    def test_cli_passes_realtime_to_runner(
+        self, monkeypatch: pytest.MonkeyPatch, role: str
+    ) -> None:
+        runner = mock.Mock(return_value=0)
+        monkeypatch.setattr(serialtest, f"run_{role}", runner)
+        argv = ["serialtest.py", "-d", "/dev/null", "-r", role, "--realtime"]
+        monkeypatch.setattr(sys, "argv", argv)
+
+        assert serialtest.main() == 0
+        assert runner.call_args.kwargs["realtime"] is True
+
+    @pytest.mark.parametrize("realtime", [True, False])
+    def test_run_client_enables_realtime(self, realtime: bool) -> None:
+        with (
+            mock.patch("client.runner.enable_realtime_scheduling") as enable,
+            mock.patch("client.runner.open_serial", side_effect=OSError("no port")),
+        ):
+            result = run_client(
+                "/dev/null", 115200, False, 1, 1, no_latency_fix=True, realtime=realtime
+            )
+
+        assert result == 1
+        assert enable.called is realtime
+
+    @pytest.mark.parametrize("realtime", [True, False])
+    @pytest.mark.usefixtures("restore_signal_handlers")
+    def test_run_server_enables_realtime(self, realtime: bool) -> None:
+        with (
+            mock.patch("server.runner.enable_realtime_scheduling") as enable,
+            mock.patch("server.runner.open_serial", side_effect=OSError("no port")),
+        ):
+            result = run_server("/dev/null", 115200, False, no_latency_fix=True, realtime=realtime)
+
+        assert result == 1
+        assert enable.called is realtime
@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 """Tests for serialtest.py CLI and CTS diagnostic features."""
 
+import os
+import pty
+import signal
 import subprocess
 import sys
+import time
+import tty
 import unittest
 from pathlib import Path
+from unittest import mock
+
+from server.runner import run_server
+from test.conftest import MockSerialPort
 
 # Path to serialtest.py (parent directory of test/)
 _SCRIPT_DIR = Path(__file__).parent.parent
@@ -62,5 +71,115 @@ class TestFlowControlCLI(unittest.TestCase):
         self.assertNotIn("software", proc.stdout.lower())
 
 
+class TestPipelineDepthCLI(unittest.TestCase):
+    """Test --pipeline-depth validation."""
+
+    def test_pipeline_depth_above_limit_rejected(self) -> None:
+        """Verify a burst too large for the tty transmit buffer is rejected."""
+        proc = subprocess.run(
+            [sys.executable, str(_SERIAL), "-d", "/dev/null", "-r", "client", "-p", "15"],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(proc.returncode, 2)
+        self.assertIn("--pipeline-depth must be between 1 and 14", proc.stderr)
+
+    def test_pipeline_depth_zero_rejected(self) -> None:
+        """Verify a pipeline depth below 1 is rejected."""
+        proc = subprocess.run(
+            [sys.executable, str(_SERIAL), "-d", "/dev/null", "-r", "client", "-p", "0"],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(proc.returncode, 2)
+        self.assertIn("--pipeline-depth", proc.stderr)
+
+
+class TestLogLevelEnv(unittest.TestCase):
+    """Test SERIAL_LOG_LEVEL handling."""
+
+    def _run_help(self, level: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, str(_SERIAL), "--help"],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "SERIAL_LOG_LEVEL": level},
+        )
+
+    def test_unknown_level_falls_back(self) -> None:
+        """Verify an unknown level warns and falls back instead of crashing."""
+        proc = self._run_help("verbose")
+        self.assertEqual(proc.returncode, 0)
+        self.assertIn("unknown SERIAL_LOG_LEVEL 'VERBOSE'", proc.stderr)
+        self.assertNotIn("Traceback", proc.stderr)
+
+    def test_known_and_numeric_levels_accepted(self) -> None:
+        """Verify level names (including TRACE) and numbers are accepted."""
+        for level in ("trace", "INFO", "15"):
+            with self.subTest(level=level):
+                proc = self._run_help(level)
+                self.assertEqual(proc.returncode, 0)
+                self.assertEqual(proc.stderr, "")
+
+
+@unittest.skipUnless(sys.platform == "linux", "pty-backed server test requires Linux")
+class TestServerShutdownCLI(unittest.TestCase):
+    """Test server shutdown on signals while waiting for a client."""
+
+    def test_sigterm_while_idle_in_handshake(self) -> None:
+        """Verify SIGTERM interrupts the handshake wait and exits cleanly."""
+        master, slave = pty.openpty()
+        self.addCleanup(os.close, master)
+        self.addCleanup(os.close, slave)
+        tty.setraw(slave)
+
+        proc = subprocess.Popen(
+            [sys.executable, str(_SERIAL), "-d", os.ttyname(slave), "-f", "none", "-r", "server"],
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        self.addCleanup(proc.kill)
+        assert proc.stderr is not None
+        self.addCleanup(proc.stderr.close)
+
+        # Wait until the server is inside its handshake loop
+        for line in proc.stderr:
+            if "waiting for connections" in line:
+                break
+        time.sleep(0.3)
+
+        start = time.monotonic()
+        proc.send_signal(signal.SIGTERM)
+        returncode = proc.wait(timeout=5)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(returncode, 0)
+        # Without interrupting the wait this takes up to HANDSHAKE_POLL_S (1s)
+        self.assertLess(elapsed, 0.5)
+        self.assertIn("Server shutdown complete", proc.stderr.read())
+
+
+class TestServerStartupSignal(unittest.TestCase):
+    """Test server handling of signals that arrive before the main loop."""
+
+    def setUp(self) -> None:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+
+    def test_sigterm_while_opening_port(self) -> None:
+        """Verify a signal during open_serial exits cleanly instead of failing."""
+
+        def open_and_signal(*_args: object, **_kwargs: object) -> MockSerialPort:
+            os.kill(os.getpid(), signal.SIGTERM)
+            return MockSerialPort()
+
+        with mock.patch("server.runner.open_serial", side_effect=open_and_signal):
+            with mock.patch("server.runner.server_handshake") as handshake:
+                result = run_server("/dev/null", 115200, rtscts=False, no_latency_fix=True)
+
+        self.assertEqual(result, 0)
+        handshake.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
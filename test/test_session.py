@@ -7,11 +7,16 @@ import pytest
 
 from common.connection import Connection, Role
 from common.encoding import encode_control, encode_data
-from common.protocol import MsgType
+from common.protocol import MAX_PIPELINE_DEPTH, MsgType
 from session.exchange import client_exchange, server_exchange, wait_for_fin
 from session.report import SessionReport
 from session.result import SessionError, SessionResult
-from test.conftest import ConnectedMockPorts, MockSerialPort
+from test.conftest import (
+    ConnectedMockPorts,
+    EchoingMockPort,
+    MockSerialPort,
+    WriteTimeoutMockPort,
+)
 
 
 @pytest.mark.unit
@@ -416,6 +421,47 @@ class TestClientExchange:
         assert result.success is False
         assert "FIN" in str(result.error)
 
+    def test_client_exchange_pipelined(self) -> None:
+        """Test client_exchange sends bursts of pipeline_depth messages per write."""
+        conn_id = b"\x01\x02\x03\x04"
+        conn = Connection(connection_id=conn_id, role=Role.CLIENT)
+        port = EchoingMockPort(conn_id)
+
+        result = client_exchange(port, conn, msg_count=10, pipeline_depth=4)
+
+        assert result.success is True
+        assert result.sent == 10
+        assert result.received == 10
+        assert result.crc_ok == 10
+        assert len(result.rtt_samples) == 10
+        # Bursts of 4, 4 and 2 messages, then one FIN
+        assert port.writes == 4
+        assert result.fin_ack_received is True
+
+    @pytest.mark.parametrize("pipeline_depth", [0, -1, MAX_PIPELINE_DEPTH + 1])
+    def test_client_exchange_rejects_invalid_pipeline_depth(self, pipeline_depth: int) -> None:
+        """Test client_exchange rejects depths outside 1..MAX_PIPELINE_DEPTH."""
+        conn_id = b"\x01\x02\x03\x04"
+        conn = Connection(connection_id=conn_id, role=Role.CLIENT)
+        port = EchoingMockPort(conn_id)
+
+        with pytest.raises(ValueError, match="pipeline_depth must be between 1 and"):
+            client_exchange(port, conn, msg_count=10, pipeline_depth=pipeline_depth)
+        assert port.writes == 0
+
+    def test_client_exchange_write_timeout(self) -> None:
+        """Test client_exchange fails cleanly when a write times out."""
+        conn = Connection(connection_id=b"\x01\x02\x03\x04", role=Role.CLIENT)
+        port = WriteTimeoutMockPort()
+
+        result = client_exchange(port, conn, msg_count=10, pipeline_depth=4)
+
+        assert result.success is False
+        assert isinstance(result.error, SessionError)
+        assert "Write timeout sending message 1" in str(result.error)
+        assert result.sent == 0
+        assert result.received == 0
+
 
 @pytest.mark.unit
 class TestServerExchange: